@@ -0,0 +1,164 @@
+"""
+Generates a synthetic data directory, in the format of data/, with N players
+and M finished tournaments of R rounds each. The same seed always produces
+the same players, tournaments, pairings and results.
+
+Usage: python -m benchmarks.generator DATA_DIR [--players 1000]
+       [--tournaments 50] [--rounds 5] [--tournament-players 16] [--seed 0]
+"""
+import argparse
+import random
+import uuid
+from datetime import date, timedelta
+
+from models.player import Player
+from models.tournament import Tournament
+from storage.json_repository import JsonRepository
+
+LAST_NAMES = ("MARTIN", "BERNARD", "DUBOIS", "THOMAS", "ROBERT", "RICHARD",
+              "PETIT", "DURAND", "LEROY", "MOREAU", "SIMON", "LAURENT",
+              "LEFEBVRE", "MICHEL", "GARCIA", "DAVID", "BERTRAND", "ROUX",
+              "VINCENT", "FOURNIER", "MOREL", "GIRARD", "ANDRE", "MERCIER")
+FIRST_NAMES = ("Jean", "Marie", "Pierre", "Sophie", "Louis", "Camille",
+               "Paul", "Julie", "Hugo", "Léa", "Lucas", "Emma", "Jules",
+               "Chloé", "Arthur", "Manon")
+LOCATIONS = ("Paris", "Lyon", "Marseille", "Toulouse", "Nantes", "Lille",
+             "Bordeaux", "Strasbourg", "Rennes", "Montpellier")
+DATE_FORMAT = "%d/%m/%Y"
+
+
+def generate_id(generator):
+    """Returns a random UUID drawn from the seeded generator."""
+    return str(uuid.UUID(int=generator.getrandbits(128), version=4))
+
+
+def generate_players(count, generator):
+    """
+    Generates registered players with unique national IDs.
+
+    Args:
+        count (int): The number of players.
+        generator (random.Random): The seeded random generator.
+
+    Returns:
+        list: The Player objects.
+    """
+    players = []
+    for index in range(count):
+        # 2 letters and 5 digits, unique for up to 67 million players
+        letters = divmod(index // 100000, 26)
+        national_id = (f"{chr(65 + letters[0] % 26)}{chr(65 + letters[1])}"
+                       f"{index % 100000:05d}")
+        birth_date = date(1940, 1, 1) + timedelta(days=generator.randrange(25000))
+        players.append(Player(f"{generator.choice(LAST_NAMES)}{index}",
+                              generator.choice(FIRST_NAMES),
+                              birth_date.strftime(DATE_FORMAT), national_id,
+                              player_id=generate_id(generator)))
+    return players
+
+
+def generate_tournament(number, players, round_count, generator):
+    """
+    Generates a finished tournament whose rounds were paired by the
+    application and played with random results.
+
+    Args:
+        number (int): The number of the tournament, used in its name.
+        players (list): The registered players taking part.
+        round_count (int): The number of rounds.
+        generator (random.Random): The seeded random generator.
+
+    Returns:
+        Tournament: The finished tournament.
+    """
+    start_date = date(2015, 1, 1) + timedelta(days=generator.randrange(3650))
+    end_date = start_date + timedelta(days=1)
+    tournament = Tournament(f"Open {number}", generator.choice(LOCATIONS),
+                            start_date.strftime(DATE_FORMAT),
+                            end_date.strftime(DATE_FORMAT),
+                            round_count, len(players), "Tournoi généré")
+    tournament.reference = generate_id(generator)
+    # Copies, as the points and opponents are specific to the tournament
+    tournament.assign_players([Player.from_dict(player.to_dict())
+                               for player in players])
+    for round_number in range(1, round_count + 1):
+        round_instance = tournament.create_round(round_number)
+        round_instance.create_pairs()
+        round_instance.matches = round_instance.pairs
+        for match in round_instance.matches:
+            match.update_score(generator.choice((1, 2, 3)))
+            for player, score in match.match:
+                player.update_player_total_points(score)
+            black, white = match.match[0][0], match.match[1][0]
+            black.add_opponent(white)
+            white.add_opponent(black)
+            match.mark_match_as_finished()
+        # The first half of the rounds is played on the first day
+        day = (tournament.start_date if round_number <= round_count // 2
+               else tournament.end_date)
+        round_instance.start_time = f"{day} {9 + round_number:02d}:00:00"
+        round_instance.end_time = f"{day} {10 + round_number:02d}:00:00"
+    tournament.rounds_completed = True
+    tournament.finalize_tournament()
+    return tournament
+
+
+def generate(data_dir, player_count, tournament_count, round_count,
+             tournament_players=16, seed=0):
+    """
+    Writes the players and tournaments of a synthetic data directory.
+
+    Args:
+        data_dir (str): The directory to write, in the format of data/.
+        player_count (int): The number of registered players.
+        tournament_count (int): The number of finished tournaments.
+        round_count (int): The number of rounds of each tournament.
+        tournament_players (int): The number of players of each tournament,
+        rounded down to an even number and capped by player_count.
+        seed (int): The seed of the random generators.
+
+    Returns:
+        dict: The generated sizes.
+    """
+    generator = random.Random(seed)
+    # The first round pairing shuffles the players with the random module
+    random.seed(seed)
+    players = generate_players(player_count, generator)
+    tournament_players = min(tournament_players, player_count) // 2 * 2
+    tournaments = [generate_tournament(number,
+                                       generator.sample(players, tournament_players),
+                                       round_count, generator)
+                   for number in range(1, tournament_count + 1)
+                   if tournament_players >= 2]
+    repository = JsonRepository(data_dir)
+    repository.save_players([player.to_dict() for player in players])
+    repository.save_tournaments([tournament.to_dict() for tournament in tournaments])
+    return {"players": len(players), "tournaments": len(tournaments),
+            "rounds": round_count, "tournament_players": tournament_players,
+            "seed": seed}
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Génère des joueurs et des tournois terminés au format de data/.")
+    parser.add_argument("data_dir", help="Dossier de données à créer.")
+    parser.add_argument("--players", type=int, default=1000,
+                        help="Nombre de joueurs enregistrés.")
+    parser.add_argument("--tournaments", type=int, default=50,
+                        help="Nombre de tournois terminés.")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Nombre de rondes par tournoi.")
+    parser.add_argument("--tournament-players", type=int, default=16,
+                        help="Nombre de joueurs par tournoi.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Graine du générateur aléatoire.")
+    args = parser.parse_args()
+    sizes = generate(args.data_dir, args.players, args.tournaments, args.rounds,
+                     args.tournament_players, args.seed)
+    print(f"{sizes['players']} joueurs et {sizes['tournaments']} tournois de "
+          f"{sizes['rounds']} rondes écrits dans {args.data_dir}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Timing helpers shared by the benchmarks.
+"""
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows: the peak memory is then not reported
+    resource = None
+
+
+def percentile(values, fraction):
+    """
+    Computes a percentile by linear interpolation between the closest ranks.
+
+    Args:
+        values (list): The measured values.
+        fraction (float): The percentile, between 0 and 1 (e.g. 0.95).
+
+    Returns:
+        float: The percentile of the values.
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(function, repeat, setup=None, warmup=1):
+    """
+    Times repeated calls of a function with time.perf_counter.
+
+    Args:
+        function (callable): The operation to time.
+        repeat (int): The number of timed calls.
+        setup (callable, optional): Called before each call, outside of
+        the timing (e.g. to drop a cache).
+        warmup (int): The number of untimed calls made first.
+
+    Returns:
+        dict: The number of calls and the min, p50, p95, max and mean
+        durations, in seconds.
+    """
+    durations = []
+    for iteration in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        duration = time.perf_counter() - start
+        if iteration >= warmup:
+            durations.append(duration)
+    return {
+        "count": len(durations),
+        "min": min(durations),
+        "p50": percentile(durations, 0.5),
+        "p95": percentile(durations, 0.95),
+        "max": max(durations),
+        "mean": sum(durations) / len(durations),
+    }
+
+
+def peak_rss():
+    """
+    Returns the peak resident memory of the current process.
+
+    On Linux, the high-water mark of the process memory (VmHWM) is read, as
+    ru_maxrss also accounts for the memory of the parent process when the
+    process was started.
+
+    Returns:
+        int: The peak RSS in bytes, or None if it cannot be measured.
+    """
+    try:
+        with open("/proc/self/status", 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
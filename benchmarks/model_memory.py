@@ -0,0 +1,75 @@
+"""
+Measures the memory held by the model objects of a loaded archive: the
+players, rounds and matches built by Tournament.load_tournaments.
+
+The default archive holds 250 finished tournaments of 16 players and
+5 rounds, i.e. 10000 matches.
+
+Usage: python -m benchmarks.model_memory [--tournaments 250] [--rounds 5]
+       [--tournament-players 16]
+"""
+import argparse
+import gc
+import os
+import shutil
+import tempfile
+import tracemalloc
+
+from benchmarks import generator
+from models.tournament import Tournament
+from storage.json_repository import JsonRepository
+from storage.repository import set_repository
+
+
+def measure_archive(data_dir):
+    """
+    Loads every tournament of a data directory with all its rounds and
+    measures the memory still allocated by the loaded objects.
+
+    Args:
+        data_dir (str): The data directory.
+
+    Returns:
+        tuple: The loaded tournaments, and the allocated memory in bytes.
+    """
+    set_repository(JsonRepository(data_dir))
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tournaments = Tournament.load_tournaments()
+    for tournament in tournaments:
+        tournament.hydrate_rounds()
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return tournaments, allocated
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Mesure la mémoire occupée par les tournois chargés.")
+    parser.add_argument("--tournaments", type=int, default=250,
+                        help="Nombre de tournois de l'archive.")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Nombre de rondes par tournoi.")
+    parser.add_argument("--tournament-players", type=int, default=16,
+                        help="Nombre de joueurs par tournoi.")
+    args = parser.parse_args()
+    work_dir = tempfile.mkdtemp(prefix="chess-memory-")
+    try:
+        data_dir = os.path.join(work_dir, "data")
+        generator.generate(data_dir, max(args.tournament_players, 1000),
+                           args.tournaments, args.rounds, args.tournament_players)
+        tournaments, allocated = measure_archive(data_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    match_count = sum(len(round_instance.matches) for tournament in tournaments
+                      for round_instance in tournament.rounds)
+    print(f"{len(tournaments)} tournois, {match_count} matchs chargés : "
+          f"{allocated / 1048576:.2f} Mo "
+          f"({allocated / max(match_count, 1):.0f} octets par match).")
+
+
+if __name__ == "__main__":
+    main()
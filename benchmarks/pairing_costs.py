@@ -0,0 +1,106 @@
+"""
+Compares the NumPy and pure-Python computations of the pairing costs.
+
+Usage: python -m benchmarks.pairing_costs [--sizes 64 256 1024] [--repeat 3]
+"""
+import argparse
+import random
+import time
+
+from models import pairing
+from models.pairing import SwissPairing
+from models.player import Player
+from models.tournament import Tournament
+
+
+def build_tournament(player_count, round_count, seed):
+    """
+    Builds a tournament whose first rounds were paired and played at random.
+
+    Args:
+        player_count (int): The number of players.
+        round_count (int): The number of rounds already played.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        Tournament: The tournament, ready to pair its next round.
+    """
+    generator = random.Random(seed)
+    tournament = Tournament("Benchmark", "Paris", "01/01/2024", "02/01/2024",
+                            round_count + 1, player_count)
+    tournament.assign_players([Player(f"NOM{i:05d}", "Prénom", "01/01/2000",
+                                      f"AB{i:05d}") for i in range(player_count)])
+    for round_number in range(1, round_count + 1):
+        round_instance = tournament.create_round(round_number)
+        round_instance.create_random_pairs()
+        round_instance.matches = round_instance.pairs
+        for match in round_instance.matches:
+            match.update_score(generator.randint(1, 3))
+            (black, black_score), (white, white_score) = match.match
+            black.update_player_total_points(black_score)
+            white.update_player_total_points(white_score)
+            black.add_opponent(white)
+            white.add_opponent(black)
+            match.mark_match_as_finished()
+    return tournament
+
+
+def time_call(function, repeat):
+    """Returns the best duration of `repeat` calls of function, in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def run(sizes, round_count, repeat):
+    """
+    Times the cost computation (complete graph) and the whole pairing,
+    with and without NumPy.
+
+    Returns:
+        list: A list of (size, path, edges duration, pairing duration) tuples.
+    """
+    numpy_module = pairing.get_numpy()
+    paths = [("python", None)]
+    if numpy_module is not None:
+        paths.append(("numpy", numpy_module))
+    results = []
+    for size in sizes:
+        tournament = build_tournament(size, round_count, seed=size)
+        for path, module in paths:
+            pairing.numpy = module
+            try:
+                edges = time_call(lambda: SwissPairing(
+                    tournament.selected_players, tournament.rounds).build_edges(None),
+                    repeat)
+                pairs = time_call(lambda: SwissPairing(
+                    tournament.selected_players, tournament.rounds).pair(), repeat)
+            finally:
+                pairing.numpy = numpy_module
+            results.append((size, path, edges, pairs))
+    return results
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compare les calculs NumPy et Python des coûts d'appariement.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024],
+                        help="Nombres de joueurs à tester.")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Nombre de rondes déjà jouées.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Nombre de mesures par cas (la meilleure est gardée).")
+    args = parser.parse_args()
+    if pairing.get_numpy() is None:
+        print("NumPy n'est pas installé : seul le calcul Python est mesuré.")
+    print(f"{'joueurs':>8} {'calcul':>7} {'coûts (s)':>10} {'appariement (s)':>16}")
+    for size, path, edges, pairs in run(args.sizes, args.rounds, args.repeat):
+        print(f"{size:>8} {path:>7} {edges:>10.4f} {pairs:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
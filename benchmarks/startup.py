@@ -0,0 +1,80 @@
+"""
+Measures the startup time of the interactive application with
+python -X importtime: the imports needed to show the main menu.
+
+Usage: python -m benchmarks.startup [--repeat 5] [--top 10] [--budget-ms 50]
+
+With --budget-ms, the exit status is 1 when the best startup time exceeds
+the budget, so the benchmark can guard against slow imports creeping back.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Code run up to the first display of the main menu, from the entry point
+STARTUP_CODE = ("import main; "
+                "from controllers.main_controller import MainController; "
+                "MainController()")
+
+
+def measure_imports():
+    """
+    Runs the startup code in a fresh interpreter with -X importtime.
+
+    Returns:
+        list: A list of (module, self time, cumulative time) tuples, in
+        microseconds, for the modules imported by the application.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_CODE],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, module = line[len("import time:"):].split("|")
+        imports.append((module.strip(), int(self_time), int(cumulative_time)))
+    return imports
+
+
+def startup_time(imports):
+    """
+    Returns the import time of the startup, in microseconds: the cumulative
+    time of the main module import (the interpreter's own imports are
+    excluded).
+    """
+    return sum(cumulative_time for module, _, cumulative_time in imports
+               if module == "main")
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Mesure le temps d'import au démarrage de l'application.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Nombre de mesures (la meilleure est gardée).")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Nombre de modules les plus lents à afficher.")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Temps de démarrage maximal accepté, en ms.")
+    args = parser.parse_args()
+    runs = [measure_imports() for _ in range(args.repeat)]
+    best = min(runs, key=startup_time)
+    total_ms = startup_time(best) / 1000
+    print(f"Imports au démarrage : {total_ms:.1f} ms "
+          f"(meilleure de {args.repeat} mesures)")
+    print(f"{'cumulé (ms)':>12} {'propre (ms)':>12}  module")
+    slowest = sorted(best, key=lambda entry: entry[2], reverse=True)[:args.top]
+    for module, self_time, cumulative_time in slowest:
+        print(f"{cumulative_time / 1000:>12.1f} {self_time / 1000:>12.1f}  {module}")
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"❌ Budget de {args.budget_ms} ms dépassé.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Measures how the main operations scale with the size of the data: loading
+the players and the tournaments, saving a tournament, pairing a round and
+generating the HTML report.
+
+For each size, a synthetic data directory is generated (see
+benchmarks.generator), then each operation is timed in a fresh process, so
+that its peak resident memory (RSS) is its own. The p50/p95 durations and
+the peak RSS are printed and written to a JSON file, to compare releases.
+
+Usage: python -m benchmarks.suite [--sizes 500:20:5 5000:200:7] [--repeat 10]
+       [--output benchmark_results.json] [--seed 0]
+
+A size is written PLAYERS:TOURNAMENTS:ROUNDS.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+from benchmarks import generator, harness
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SIZES = ("500:20:5", "5000:200:7")
+
+
+def prepare_load_players(data_dir):
+    """Loads the players from the file: the player cache is emptied first."""
+    from models.player import Player
+    from storage.repository import get_player_cache
+    return get_player_cache().invalidate, Player.load_players
+
+
+def prepare_load_tournaments(data_dir):
+    """Loads every tournament, without building their rounds."""
+    from models.tournament import Tournament
+    return None, Tournament.load_tournaments
+
+
+def prepare_load_tournament_rounds(data_dir):
+    """Loads every tournament and builds all their rounds and matches."""
+    from models.tournament import Tournament
+
+    def load():
+        for tournament in Tournament.load_tournaments():
+            tournament.hydrate_rounds()
+    return None, load
+
+
+def prepare_save_tournament_update(data_dir):
+    """Saves a modified tournament."""
+    from models.tournament import Tournament
+    tournament = Tournament.load_tournaments()[0]
+    updates = iter(range(1, 1000000))
+
+    def modify():
+        tournament.description = f"Mise à jour {next(updates)}"
+    return modify, lambda: Tournament.save_tournament_update(tournament)
+
+
+def prepare_create_pairs(data_dir):
+    """Pairs one more round of the tournament with the most rounds."""
+    from models.round import Round
+    from models.tournament import Tournament
+    tournament = max(Tournament.load_tournaments(),
+                     key=lambda tournament: len(tournament.rounds))
+    rounds = []
+
+    def new_round():
+        rounds[:] = [Round(tournament, len(tournament.rounds) + 1)]
+    return new_round, lambda: rounds[0].create_pairs()
+
+
+def prepare_generate_html_report(data_dir):
+    """Renders every page of the report: the report manifest is removed first."""
+    from controllers.report_controller import ReportController
+    output_dir = os.path.join(data_dir, os.pardir, "reports")
+    controller = ReportController()
+
+    def remove_manifest():
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(output_dir, ReportController.MANIFEST_FILE))
+    return remove_manifest, lambda: controller.generate_html_report(
+        output_dir=output_dir)
+
+
+# Operation name -> function returning its (setup, operation) callables
+OPERATIONS = {
+    "load_players": prepare_load_players,
+    "load_tournaments": prepare_load_tournaments,
+    "load_tournament_rounds": prepare_load_tournament_rounds,
+    "save_tournament_update": prepare_save_tournament_update,
+    "create_pairs": prepare_create_pairs,
+    "generate_html_report": prepare_generate_html_report,
+}
+
+
+def run_operation(operation, data_dir, repeat):
+    """
+    Times an operation on a data directory, in the current process.
+
+    Args:
+        operation (str): The name of the operation (see OPERATIONS).
+        data_dir (str): The data directory.
+        repeat (int): The number of timed calls.
+
+    Returns:
+        dict: The durations (see harness.measure) and the peak RSS.
+    """
+    from storage.json_repository import JsonRepository
+    from storage.repository import set_repository
+    set_repository(JsonRepository(data_dir))
+    # The operations' messages would mix with the JSON result
+    with contextlib.redirect_stdout(sys.stderr):
+        setup, function = OPERATIONS[operation](data_dir)
+        timings = harness.measure(function, repeat, setup)
+    return {**timings, "peak_rss": harness.peak_rss()}
+
+
+def run_operation_in_process(operation, data_dir, repeat):
+    """Runs run_operation() in a fresh interpreter and returns its result."""
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--operation", operation,
+         "--data-dir", data_dir, "--repeat", str(repeat)],
+        cwd=BASE_DIR, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, check=True)
+    return json.loads(completed.stdout)
+
+
+def parse_size(size):
+    """Parses a PLAYERS:TOURNAMENTS:ROUNDS size into a tuple of integers."""
+    try:
+        players, tournaments, rounds = (int(value) for value in size.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Taille invalide : {size} (JOUEURS:TOURNOIS:RONDES attendu).")
+    return players, tournaments, rounds
+
+
+def git_revision():
+    """Returns the current git commit of the repository, or None."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=BASE_DIR,
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, operations, repeat, seed):
+    """
+    Generates the data of each size and times each operation on it.
+
+    Returns:
+        dict: The results, with the environment they were measured in.
+    """
+    results = []
+    for players, tournaments, rounds in sizes:
+        work_dir = tempfile.mkdtemp(prefix="chess-benchmark-")
+        try:
+            data_dir = os.path.join(work_dir, "data")
+            generated = generator.generate(data_dir, players, tournaments, rounds,
+                                           seed=seed)
+            for operation in operations:
+                results.append({"operation": operation, "size": generated,
+                                **run_operation_in_process(operation, data_dir,
+                                                           repeat)})
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Mesure les opérations principales sur des données générées.")
+    parser.add_argument("--sizes", type=parse_size, nargs="+",
+                        default=[parse_size(size) for size in DEFAULT_SIZES],
+                        help="Tailles JOUEURS:TOURNOIS:RONDES à mesurer.")
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS),
+                        default=list(OPERATIONS), help="Opérations à mesurer.")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="Nombre de mesures par opération et par taille.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Graine du générateur de données.")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="Fichier JSON des résultats.")
+    parser.add_argument("--operation", help=argparse.SUPPRESS)
+    parser.add_argument("--data-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.operation:
+        # Worker process started by run_operation_in_process()
+        print(json.dumps(run_operation(args.operation, args.data_dir, args.repeat)))
+        return
+    report = run(args.sizes, args.operations, args.repeat, args.seed)
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=4)
+    print(f"{'opération':<24} {'taille':>16} {'p50 (ms)':>10} {'p95 (ms)':>10} "
+          f"{'RSS max (Mo)':>13}")
+    for result in report["results"]:
+        size = result["size"]
+        rss = result["peak_rss"]
+        print(f"{result['operation']:<24} "
+              f"{size['players']:>6}:{size['tournaments']}:{size['rounds']:<4} "
+              f"{result['p50'] * 1000:>10.2f} {result['p95'] * 1000:>10.2f} "
+              f"{rss / 1048576 if rss else float('nan'):>13.1f}")
+    print(f"Résultats écrits dans {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
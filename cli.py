@@ -0,0 +1,303 @@
+"""
+Non-interactive command-line interface, for scripted operations.
+
+Usage:
+    python cli.py players import FILE
+    python cli.py players prune [--years N] [--dry-run]
+    python cli.py tournament create --name NAME --location LOCATION
+        --start-date DD/MM/YYYY --end-date DD/MM/YYYY [--rounds N]
+        --players NATIONAL_ID [NATIONAL_ID ...]
+    python cli.py tournament pair REFERENCE --round N
+    python cli.py results apply REFERENCE FILE [--round N]
+    python cli.py report build [--jobs N] [--output DIR]
+
+Each command only imports the modules it needs. The exit status is 0 on
+success, 1 when the operation fails and 2 on invalid arguments.
+"""
+import argparse
+import sys
+
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+
+class CommandError(Exception):
+    """Error stopping a command, reported with exit status 1."""
+
+
+def find_tournament(reference):
+    """
+    Loads the tournament whose reference is, or starts with, the given one.
+
+    Args:
+        reference (str): The tournament reference, or a unique prefix of it.
+
+    Returns:
+        Tournament: The tournament.
+
+    Raises:
+        CommandError: If no tournament, or several ones, match.
+    """
+    from models.tournament import Tournament
+    matches = [summary.reference for summary in Tournament.load_tournament_summaries()
+               if summary.reference.startswith(reference)]
+    if not matches:
+        raise CommandError(f"Aucun tournoi ne correspond à la référence {reference}.")
+    if len(matches) > 1:
+        raise CommandError(f"Plusieurs tournois correspondent à la référence "
+                           f"{reference}.")
+    return Tournament.load_tournament(matches[0])
+
+
+def import_players(args):
+    """
+    Registers the players listed in a CSV, JSONL or JSON file, in one write.
+    The valid players are imported even if other rows are rejected.
+    """
+    from models.player import Player
+    try:
+        players, errors = Player.import_players(args.file)
+    except (OSError, ValueError) as e:
+        raise CommandError(f"Fichier de joueurs illisible : {e}")
+    print(f"✅ {len(players)} joueurs importés.")
+    if errors:
+        raise CommandError("\n".join(errors))
+
+
+def prune_players(args):
+    """
+    Deletes the players whose last tournament ended before the last years.
+    Players of unfinished tournaments are always kept, and players who
+    never played a tournament are only deleted with --never-played.
+    """
+    from datetime import datetime
+    from models.player import Player
+    from models.tournament import Tournament
+    if args.years < 1:
+        raise CommandError("--years doit être supérieur ou égal à 1.")
+    today = datetime.now()
+    # 29 February becomes 28 February, which exists every year
+    day = 28 if (today.month, today.day) == (2, 29) else today.day
+    since = today.replace(year=today.year - args.years, day=day)
+    last_dates = Tournament.last_tournament_dates()
+
+    def last_tournament_date(player):
+        dates = [last_dates[key] for key in (player.id, player.national_id)
+                 if key in last_dates]
+        return max(dates) if dates else None
+
+    def is_inactive(player):
+        last_date = last_tournament_date(player)
+        if last_date is None:
+            return args.never_played
+        return last_date < since
+
+    players = Player.delete_players_where(is_inactive, dry_run=args.dry_run)
+    for player in players:
+        last_date = last_tournament_date(player)
+        if last_date is None:
+            print(f"- {player} (aucun tournoi)")
+        else:
+            print(f"- {player} (dernier tournoi : {last_date:%d/%m/%Y})")
+    if args.dry_run:
+        print(f"{len(players)} joueurs seraient supprimés.")
+    else:
+        print(f"✅ {len(players)} joueurs supprimés.")
+
+
+def create_tournament(args):
+    """Creates a tournament with registered players."""
+    from models.player import Player
+    from models.tournament import Tournament
+    from utils import date_utils
+    for date in (args.start_date, args.end_date):
+        if not date_utils.validate_date(date):
+            raise CommandError(f"Date invalide : {date} (JJ/MM/AAAA attendu).")
+    if args.rounds < 1:
+        raise CommandError("Le nombre de rounds doit être supérieur à 0.")
+    national_ids = [national_id.upper() for national_id in args.players]
+    players_by_national_id = {national_id: Player.find_by_national_id(national_id)
+                              for national_id in national_ids}
+    unknown = [national_id for national_id in national_ids
+               if players_by_national_id[national_id] is None]
+    if unknown:
+        raise CommandError(f"Joueurs inconnus : {', '.join(unknown)}")
+    if len(set(national_ids)) != len(national_ids):
+        raise CommandError("Un joueur est sélectionné plusieurs fois.")
+    if len(national_ids) < 2 or len(national_ids) % 2:
+        raise CommandError("Le nombre de joueurs doit être pair et au moins égal à 2.")
+    tournament = Tournament.create_tournament(args.name, args.location,
+                                              args.start_date, args.end_date,
+                                              args.rounds, len(national_ids))
+    tournament.assign_players([players_by_national_id[national_id]
+                               for national_id in national_ids])
+    Tournament.add_tournament(tournament)
+    print(tournament.reference)
+
+
+def pair_round(args):
+    """Creates and pairs the next round of a tournament."""
+    from models.tournament import Tournament
+    tournament = find_tournament(args.reference)
+    if tournament.rounds_completed:
+        raise CommandError("Tous les rounds du tournoi ont été joués.")
+    if not 1 <= args.round <= tournament.number_of_rounds:
+        raise CommandError(f"Le tournoi compte {tournament.number_of_rounds} rounds.")
+    round_instance = next((round_instance for round_instance in tournament.rounds
+                           if round_instance.round_number == args.round), None)
+    if round_instance is None:
+        if args.round != len(tournament.rounds) + 1:
+            raise CommandError(f"Le prochain round à apparier est le round "
+                               f"{len(tournament.rounds) + 1}.")
+        if any(not match.finished for previous in tournament.rounds
+               for match in previous.matches):
+            raise CommandError("Le round précédent n'est pas terminé.")
+        round_instance = tournament.create_round(args.round)
+    if not round_instance.matches:
+        tournament.start_tournament()
+        round_instance.create_pairs()
+        round_instance.matches = round_instance.pairs
+        Tournament.save_tournament_progress(tournament)
+        Tournament.flush_saves()
+    for board, match in enumerate(round_instance.matches, start=1):
+        black, white = match.match[0][0], match.match[1][0]
+        print(f"{board}: {black.first_name} {black.last_name} (Noirs) - "
+              f"{white.first_name} {white.last_name} (Blancs)")
+
+
+def apply_results(args):
+    """Applies the results of a round from a CSV or JSON file."""
+    from models.tournament import Tournament
+    from utils import date_utils, result_utils
+    tournament = find_tournament(args.reference)
+    if not tournament.rounds:
+        raise CommandError("Aucun round n'a été apparié.")
+    if args.round is None:
+        round_instance = tournament.rounds[-1]
+    else:
+        round_instance = next((round_instance for round_instance in tournament.rounds
+                               if round_instance.round_number == args.round), None)
+        if round_instance is None:
+            raise CommandError(f"Le round {args.round} n'a pas été apparié.")
+    results, errors = result_utils.load_results_file(args.file)
+    errors = round_instance.validate_results(results, errors)
+    if errors:
+        raise CommandError("\n".join(errors))
+    round_instance.apply_results(results)
+    if all(match.finished for match in round_instance.matches):
+        round_instance.end_time = date_utils.get_current_datetime()
+        if round_instance.record_opponents():
+            print("Joueurs introuvables dans le tournoi : historique des "
+                  "adversaires incomplet.", file=sys.stderr)
+        if (len(tournament.rounds) == tournament.number_of_rounds
+                and all(match.finished for previous in tournament.rounds
+                        for match in previous.matches)):
+            tournament.rounds_completed = True
+            tournament.finalize_tournament()
+    Tournament.save_tournament_progress(tournament)
+    Tournament.flush_saves()
+    print(f"✅ {len(results)} résultats enregistrés pour le round "
+          f"{round_instance.round_number}.")
+
+
+def build_report(args):
+    """Generates the HTML report of the tournaments."""
+    from controllers.report_controller import ReportController
+    if args.jobs < 1:
+        raise CommandError("--jobs doit être supérieur ou égal à 1.")
+    if ReportController(jobs=args.jobs).generate_html_report(
+            output_dir=args.output) is None:
+        raise CommandError("Le rapport n'a pas été généré.")
+
+
+def build_parser():
+    """
+    Builds the parser of the command line.
+
+    Returns:
+        argparse.ArgumentParser: The parser; each command sets its handler
+        as the `handler` default.
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Gestion des tournois d'échecs sans interface interactive.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    players = commands.add_parser("players", help="Gestion des joueurs.")
+    players_commands = players.add_subparsers(dest="action", required=True)
+    players_import = players_commands.add_parser(
+        "import", help="Importe des joueurs depuis un fichier CSV, JSONL ou JSON.")
+    players_import.add_argument("file", help="Fichier des joueurs.")
+    players_import.set_defaults(handler=import_players)
+    players_prune = players_commands.add_parser(
+        "prune", help="Supprime les joueurs sans tournoi depuis plusieurs années.")
+    players_prune.add_argument("--years", type=int, default=5,
+                               help="Nombre d'années sans tournoi (5 par défaut).")
+    players_prune.add_argument("--never-played", action="store_true",
+                               help="Supprime aussi les joueurs qui n'ont "
+                                    "jamais participé à un tournoi.")
+    players_prune.add_argument("--dry-run", action="store_true",
+                               help="Affiche les joueurs sans les supprimer.")
+    players_prune.set_defaults(handler=prune_players)
+
+    tournament = commands.add_parser("tournament", help="Gestion des tournois.")
+    tournament_commands = tournament.add_subparsers(dest="action", required=True)
+    tournament_create = tournament_commands.add_parser(
+        "create", help="Crée un tournoi et affiche sa référence.")
+    tournament_create.add_argument("--name", required=True)
+    tournament_create.add_argument("--location", required=True)
+    tournament_create.add_argument("--start-date", required=True)
+    tournament_create.add_argument("--end-date", required=True)
+    tournament_create.add_argument("--rounds", type=int, default=4)
+    tournament_create.add_argument("--players", nargs="+", required=True,
+                                   metavar="NATIONAL_ID",
+                                   help="Identifiants nationaux des joueurs.")
+    tournament_create.set_defaults(handler=create_tournament)
+    tournament_pair = tournament_commands.add_parser(
+        "pair", help="Apparie un round et affiche les échiquiers.")
+    tournament_pair.add_argument("reference", help="Référence du tournoi.")
+    tournament_pair.add_argument("--round", type=int, required=True)
+    tournament_pair.set_defaults(handler=pair_round)
+
+    results = commands.add_parser("results", help="Saisie des résultats.")
+    results_commands = results.add_subparsers(dest="action", required=True)
+    results_apply = results_commands.add_parser(
+        "apply", help="Enregistre les résultats d'un round depuis un fichier "
+                      "CSV ou JSON.")
+    results_apply.add_argument("reference", help="Référence du tournoi.")
+    results_apply.add_argument("file", help="Fichier des résultats.")
+    results_apply.add_argument("--round", type=int,
+                               help="Numéro du round (par défaut le dernier).")
+    results_apply.set_defaults(handler=apply_results)
+
+    report = commands.add_parser("report", help="Rapports HTML.")
+    report_commands = report.add_subparsers(dest="action", required=True)
+    report_build = report_commands.add_parser("build", help="Génère le rapport.")
+    report_build.add_argument("--jobs", type=int, default=1)
+    report_build.add_argument("--output", default=None,
+                              help="Dossier du rapport.")
+    report_build.set_defaults(handler=build_report)
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs a command.
+
+    Args:
+        argv (list, optional): The arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        args.handler(args)
+    except CommandError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_FAILURE
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
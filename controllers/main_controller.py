@@ -1,9 +1,7 @@
 import sys
-from controllers.player_controller import PlayerController
-from controllers.report_controller import ReportController
-from controllers.tournament_controller import TournamentController
 from views.main_view import MainView
 from views.base_view import BaseView
+from storage.repository import flush_writes
 
 
 class MainController:
@@ -18,15 +16,40 @@ class MainController:
     """
     def __init__(self):
         """
-        Initialize the main view and controllers for managing players,
-         tournaments, and generating reports.
+        Initialize the main view. The controllers for managing players,
+        tournaments, and generating reports are imported and created when
+        their menu is first entered, so the main menu shows up quickly.
         """
         self.main_view = MainView()
-        self.player_controller = PlayerController()
-        self.tournament_controller = TournamentController()
-        self.report_controller = ReportController()
+        self._player_controller = None
+        self._tournament_controller = None
+        self._report_controller = None
         self.base_view = BaseView()
 
+    @property
+    def player_controller(self):
+        """The PlayerController, created on first use."""
+        if self._player_controller is None:
+            from controllers.player_controller import PlayerController
+            self._player_controller = PlayerController()
+        return self._player_controller
+
+    @property
+    def tournament_controller(self):
+        """The TournamentController, created on first use."""
+        if self._tournament_controller is None:
+            from controllers.tournament_controller import TournamentController
+            self._tournament_controller = TournamentController()
+        return self._tournament_controller
+
+    @property
+    def report_controller(self):
+        """The ReportController (and Jinja2), imported on first use."""
+        if self._report_controller is None:
+            from controllers.report_controller import ReportController
+            self._report_controller = ReportController()
+        return self._report_controller
+
     def run_main_menu(self):
         """
         Runs the main menu loop, handling user input and navigating
@@ -40,7 +63,19 @@ class MainController:
         - Exit the application.
 
         If an invalid option is selected, an error message is displayed.
+        The pending saves are written before the menu is left, then the
+        instrumentation summary is reported if it is enabled.
         """
+        try:
+            self.handle_main_menu()
+        finally:
+            flush_writes()
+            # Imported here, so that it does not slow down the startup
+            from utils import instrumentation
+            instrumentation.report()
+
+    def handle_main_menu(self):
+        """Displays the main menu and dispatches the user's choices."""
         while True:
             # Display the main menu and get the user's choice
             choice = self.main_view.display_main_menu()
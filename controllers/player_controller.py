@@ -20,7 +20,9 @@ class PlayerController:
         1. Create a new player
         2. Delete a player
         3. Display registered players
-        4. Exit to the main menu
+        4. Import players from a file
+        5. Search for players
+        6. Exit to the main menu
        """
         while True:
             choice = self.player_view.display_players_menu()
@@ -31,6 +33,10 @@ class PlayerController:
             elif choice == "3":
                 self.display_sorted_players()
             elif choice == "4":
+                self.import_players()
+            elif choice == "5":
+                self.search_players()
+            elif choice == "6":
                 break
             else:
                 self.player_view.display_feedback("invalid_option")
@@ -56,6 +62,38 @@ class PlayerController:
             self.player_view.display_feedback("database_io_error",
                                               error_message=str(io_error))
 
+    def import_players(self):
+        """
+        Registers the players listed in a CSV, JSONL or JSON file.
+
+        The valid players are saved in a single write and the rejected
+        rows are reported with their line number.
+        """
+        file_path = self.player_view.get_import_file_path()
+        try:
+            players, errors = Player.import_players(file_path)
+        except (OSError, ValueError) as e:
+            self.player_view.display_feedback("import_error", error_message=str(e))
+            return
+        self.player_view.display_feedback("players_imported", players=players)
+        if errors:
+            self.player_view.display_import_errors(errors)
+
+    def search_players(self):
+        """
+        Displays the players matching a national ID, a year of birth or the
+        beginning of a last name, found through the player indexes.
+        """
+        query = self.player_view.get_search_query()
+        if not query:
+            self.player_view.display_feedback("empty_field")
+            return
+        players = Player.search_players(query)
+        if players:
+            self.player_view.display_players_list(players)
+        else:
+            self.player_view.display_feedback("no_matching_players")
+
     def delete_player(self):
         """
         Handles the deletion of a player by allowing the user to select
@@ -222,12 +260,15 @@ class PlayerController:
 
     def check_new_player_national_id(self):
         """
-        Collects and validates the player's national ID.
+        Collects and validates the player's national ID, which must not be
+        registered yet.
         """
         while True:
             national_id = self.player_view.get_new_player_national_id()
             if not Player.validate_national_id(national_id):
                 self.player_view.display_feedback("invalid_national_id")
+            elif Player.find_by_national_id(national_id):
+                self.player_view.display_feedback("national_id_taken")
             else:
                 return national_id.upper()
 
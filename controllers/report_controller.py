@@ -1,12 +1,43 @@
-from jinja2 import Environment, FileSystemLoader
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import argparse
+import hashlib
+import json
 import os
-import webbrowser
 
-from models.tournament import Tournament
+from models.tournament import Tournament, TournamentSummary
 from controllers.tournament_controller import TournamentController
+from views import report_templates
 from views.player_view import PlayerView
 from views.report_view import ReportView
 from views.tournament_view import TournamentView
+from utils import instrumentation, profiling
+
+# Page template compiled once by each process of the rendering pool
+_worker_page_template = None
+
+
+def init_page_worker(template_name):
+    """
+    Initializes a process of the rendering pool: loads its own copy of the
+    tournament page template, from the bytecode cache when it is filled.
+
+    Args:
+        template_name (str): The name of the tournament page template.
+    """
+    global _worker_page_template
+    _worker_page_template = report_templates.get_template(template_name)
+
+
+def render_tournament_page(state, output_file):
+    """
+    Renders the page of a tournament in a process of the rendering pool.
+
+    Args:
+        state (dict): The serialized tournament.
+        output_file (str): Path to the output HTML file.
+    """
+    ReportController.render_page(_worker_page_template, output_file,
+                                 tournament=Tournament.from_dict(state))
 
 
 class ReportController:
@@ -19,8 +50,35 @@ class ReportController:
        and displaying them in the web browser. The controller interacts
        with the database to retrieve tournament data,
        and uses Jinja2 templates to format the reports.
+
+       The report is a directory holding one page per tournament and an
+       index page. Each page is keyed in a manifest by a hash of the
+       tournament's serialized state: only the tournaments which changed
+       since the previous generation are rendered again.
+
+       Tournaments are read from the storage one at a time and the pages
+       are streamed to their files, so the memory used does not grow
+       with the size of the archive. With jobs > 1, the pages are rendered
+       by a pool of processes and the index is written once they are done.
     """
-    def __init__(self):
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    REPORT_DIR = os.path.join(BASE_DIR, 'reports')
+    MANIFEST_FILE = 'manifest.json'
+    INDEX_FILE = 'index.html'
+    # Number of template chunks buffered before being written to the file
+    STREAM_BUFFER_SIZE = 64
+    INDEX_TEMPLATE = 'tournaments_index_template.html'
+    PAGE_TEMPLATE = 'tournament_page_template.html'
+    # Templates a tournament page is rendered from, part of its hash
+    PAGE_TEMPLATE_FILES = ('report_layout.html', PAGE_TEMPLATE)
+
+    def __init__(self, jobs=1):
+        """
+        Args:
+            jobs (int, optional): Number of processes rendering the tournament
+            pages. Defaults to 1: pages are rendered in the current process.
+        """
+        self.jobs = jobs
         self.tournament_controller = TournamentController()
         self.report_view = ReportView()
         self.player_view = PlayerView()
@@ -48,17 +106,14 @@ class ReportController:
     def handle_generate_html_report(self):
         """
         Handles the generation and display of an HTML report for all tournaments.
-        This method loads the tournament data from the database,
-        generates an HTML report using a Jinja2 template,
-        and then opens the report in the default web browser.
+        This method lists the tournaments from the database,
+        generates the HTML report using Jinja2 templates,
+        and then opens its index page in the default web browser.
         """
         try:
-            tournaments = Tournament.load_tournaments()
-            if not tournaments:
-                self.report_view.display_feedback("no_tournament")
-                return
-            self.generate_html_report(tournaments)
-            self.open_report_in_browser('tournament_report.html')
+            index_file = self.generate_html_report()
+            if index_file is not None:
+                self.open_report_in_browser(index_file)
         except FileNotFoundError as fnf_error:
             self.report_view.display_feedback("fnf_error",
                                               error_message=str(fnf_error))
@@ -66,27 +121,166 @@ class ReportController:
             self.report_view.display_feedback("io_error",
                                               error_message=str(io_error))
 
-    def generate_html_report(self, tournaments, output_file='tournament_report.html'):
+    @instrumentation.timed
+    @profiling.traced_memory
+    def generate_html_report(self, tournament_states=None, output_dir=None):
         """
-        Generate an HTML report for tournaments using
-        a Jinja2 template and save it to a file.
+        Generate the HTML report of the tournaments: one page per tournament
+        plus an index page. The pages of the tournaments unchanged since
+        the previous generation are kept as they are.
 
         Args:
-            tournaments (list): List of tournament objects to include in the report.
-            output_file (str): Path to the output HTML file.
+            tournament_states (iterable, optional): The serialized tournaments
+            to include in the report. Defaults to all the stored tournaments,
+            read lazily.
+            output_dir (str): Path to the report directory. Defaults to REPORT_DIR.
+
+        Returns:
+            str: Path to the index page, or None if there is no tournament
+            or the generation failed.
         """
+        if tournament_states is None:
+            tournament_states = Tournament.iter_tournament_states()
+        output_dir = output_dir or self.REPORT_DIR
         try:
-            template_dir = os.path.join(os.path.dirname(__file__),
-                                        '..', 'views', 'templates')
-            env = Environment(loader=FileSystemLoader(template_dir))
-            template = env.get_template('tournaments_report_template.html')
-            html_output = template.render(tournaments=tournaments)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_output)
+            os.makedirs(output_dir, exist_ok=True)
+            previous_manifest = self.load_report_manifest(output_dir)
+            template_digest = self.template_digest()
+            summaries = []
+            manifest = {}
+            rendered_count = 0
+            executor = None
+            if self.jobs > 1:
+                executor = ProcessPoolExecutor(
+                    max_workers=self.jobs, initializer=init_page_worker,
+                    initargs=(self.PAGE_TEMPLATE,))
+            pending = set()
+            try:
+                for state in tournament_states:
+                    summary = TournamentSummary.from_dict(state)
+                    summaries.append(summary)
+                    entry = {"hash": self.state_digest(state, template_digest),
+                             "page": f"tournament_{summary.reference}.html"}
+                    manifest[summary.reference] = entry
+                    page_path = os.path.join(output_dir, entry["page"])
+                    if (previous_manifest.get(summary.reference) == entry
+                            and os.path.exists(page_path)):
+                        continue
+                    rendered_count += 1
+                    if executor is None:
+                        self.render_page(report_templates.get_template(
+                                             self.PAGE_TEMPLATE), page_path,
+                                         tournament=Tournament.from_dict(state))
+                        continue
+                    pending.add(executor.submit(render_tournament_page, state,
+                                                page_path))
+                    # Bounds the number of tournaments held in memory
+                    if len(pending) >= 2 * self.jobs:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                for future in pending:
+                    future.result()
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            if not summaries:
+                self.report_view.display_feedback("no_tournament")
+                return None
+            self.remove_stale_pages(output_dir, previous_manifest, manifest)
+            index_path = os.path.join(output_dir, self.INDEX_FILE)
+            self.render_page(report_templates.get_template(self.INDEX_TEMPLATE),
+                             index_path,
+                             tournaments=summaries,
+                             pages={reference: entry["page"]
+                                    for reference, entry in manifest.items()})
+            self.save_report_manifest(output_dir, manifest)
             self.report_view.display_feedback("report_success")
+            self.report_view.display_rendered_pages(rendered_count, len(manifest))
+            return index_path
         except Exception as e:
             self.report_view.display_feedback("report_generation_error",
                                               error_message=str(e))
+            return None
+
+    @classmethod
+    def render_page(cls, template, output_file, **context):
+        """
+        Renders a template to a file. The page is streamed to the file in
+        chunks instead of being built in memory.
+
+        Args:
+            template (jinja2.Template): The template to render.
+            output_file (str): Path to the output HTML file.
+            **context: The variables passed to the template.
+        """
+        stream = template.stream(**context)
+        stream.enable_buffering(cls.STREAM_BUFFER_SIZE)
+        stream.dump(output_file, encoding='utf-8')
+        if instrumentation.ENABLED:
+            instrumentation.record_io(bytes_written=os.path.getsize(output_file))
+
+    def template_digest(self):
+        """
+        Computes a hash of the templates a tournament page is rendered from,
+        so that editing them renders every page again.
+
+        Returns:
+            str: The hexadecimal digest.
+        """
+        digest = hashlib.sha256()
+        for template_name in self.PAGE_TEMPLATE_FILES:
+            with open(os.path.join(report_templates.TEMPLATE_DIR, template_name),
+                      'rb') as file:
+                digest.update(file.read())
+        return digest.hexdigest()
+
+    @staticmethod
+    def state_digest(state, template_digest):
+        """
+        Computes the hash keying the page of a tournament.
+
+        Args:
+            state (dict): The serialized tournament.
+            template_digest (str): The hash of the page templates.
+
+        Returns:
+            str: The hexadecimal digest.
+        """
+        digest = hashlib.sha256(template_digest.encode('utf-8'))
+        digest.update(json.dumps(state, sort_keys=True,
+                                 ensure_ascii=False).encode('utf-8'))
+        return digest.hexdigest()
+
+    def load_report_manifest(self, output_dir):
+        """
+        Loads the manifest of the previous generation.
+
+        Returns:
+            dict: The page file and hash by tournament reference, empty if
+            there is no usable manifest.
+        """
+        try:
+            with open(os.path.join(output_dir, self.MANIFEST_FILE), 'r',
+                      encoding='utf-8') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_report_manifest(self, output_dir, manifest):
+        """Saves the manifest of the generated pages."""
+        with open(os.path.join(output_dir, self.MANIFEST_FILE), 'w',
+                  encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=4)
+
+    @staticmethod
+    def remove_stale_pages(output_dir, previous_manifest, manifest):
+        """Deletes the pages of the tournaments which are no longer reported."""
+        for reference, entry in previous_manifest.items():
+            if reference not in manifest:
+                page_path = os.path.join(output_dir, entry["page"])
+                if os.path.exists(page_path):
+                    os.remove(page_path)
 
     def open_report_in_browser(self, output_file):
         """
@@ -95,9 +289,39 @@ class ReportController:
         Args:
             output_file (str): Path to the HTML file to open.
         """
+        import webbrowser
         try:
             file_path = os.path.abspath(output_file)
             webbrowser.open(f'file://{file_path}')
         except Exception as e:
             self.report_view.display_feedback("report_browser_error",
                                               error_message=str(e))
+
+
+def main():
+    """
+    Command-line entry point: python -m controllers.report_controller
+    [--jobs N] [--output DIR] [--precompile].
+    """
+    parser = argparse.ArgumentParser(
+        description="Génère le rapport HTML des tournois.")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Nombre de processus générant les pages des tournois.")
+    parser.add_argument("--output", default=ReportController.REPORT_DIR,
+                        help="Dossier du rapport.")
+    parser.add_argument("--precompile", action="store_true",
+                        help="Compile les templates dans le cache sans générer "
+                             "le rapport (à lancer après l'installation).")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs doit être supérieur ou égal à 1.")
+    if args.precompile:
+        template_names = report_templates.precompile_templates()
+        print(f"✅ {len(template_names)} templates compilés dans "
+              f"{report_templates.CACHE_DIR}.")
+        return
+    ReportController(jobs=args.jobs).generate_html_report(output_dir=args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from utils import date_utils
+from utils import date_utils, result_utils
 from models.player import Player
 from models.tournament import Tournament
 from views.tournament_view import TournamentView
@@ -55,6 +55,9 @@ class TournamentController:
         """
         Handles the selection and management of tournaments based on their status.
 
+        Tournaments are listed and filtered from their summaries; only
+        the selected ones are fully loaded.
+
         Args:
             filter_status (str): The status to filter tournaments by
             ("not_finished" or "finished").
@@ -62,7 +65,7 @@ class TournamentController:
         Returns:
             None
         """
-        tournaments = Tournament.load_tournaments()
+        tournaments = Tournament.load_tournament_summaries()
         uuid_index_map = (self.display_tournaments_list
                           (tournaments, filter_status=filter_status))
         if not uuid_index_map:
@@ -115,6 +118,7 @@ class TournamentController:
         self.collect_tournament_user_feedback(tournament)
         tournament.finalize_tournament()
         self.save_tournament_progress(tournament)
+        Tournament.flush_saves()
 
     def handle_round_progress(self, tournament):
         """
@@ -131,6 +135,8 @@ class TournamentController:
             self.process_round_results(tournament, round_instance)
             self.tournament_view.display_players_total_points(tournament)
             self.save_tournament_progress(tournament)
+            # The closed round must be on disk before the next one starts
+            Tournament.flush_saves()
         tournament.rounds_completed = True
         self.save_tournament_progress(tournament)
 
@@ -216,11 +222,11 @@ class TournamentController:
 
     def process_selected_tournaments(self, user_input, tournaments, uuid_index_map):
         """
-        Processes the user's selection of tournaments.
+        Processes the user's selection of tournaments and loads them.
 
         Args:
             user_input (str): The user's input indicating selected tournaments.
-            tournaments (list): The list of all available tournaments.
+            tournaments (list): The list of all available tournament summaries.
             uuid_index_map (dict): A mapping of indices to tournament UUIDs.
 
         Returns:
@@ -230,7 +236,8 @@ class TournamentController:
             indices = [int(choice.strip()) - 1 for choice in user_input.split(',')]
             selected_uuids = {uuid_index_map.get(idx + 1) for idx in indices
                               if 0 <= idx < len(tournaments)}
-            selected_tournaments = [tournament for tournament in tournaments
+            selected_tournaments = [Tournament.load_tournament(tournament.reference)
+                                    for tournament in tournaments
                                     if tournament.reference in selected_uuids]
 
             if not selected_tournaments:
@@ -271,14 +278,15 @@ class TournamentController:
         for i in range(tournament.number_of_rounds):
             if self.get_current_round(tournament, i + 1):
                 return i
-        return 0
+        # Every started round is over: the next one is created
+        return len(tournament.rounds)
 
     def filter_tournaments(self, tournaments, filter_status):
         """
         Filters the list of tournaments based on their status.
 
         Args:
-            tournaments (list): List of Tournament objects.
+            tournaments (list): List of Tournament or TournamentSummary objects.
             filter_status (str): The status to filter by. Accepted values are:
                 - 'not_started'
                 - 'in_progress'
@@ -320,7 +328,7 @@ class TournamentController:
         with optional filtering.
 
         Args:
-            tournaments (list): List of Tournament objects.
+            tournaments (list): List of Tournament or TournamentSummary objects.
             filter_status (str, optional): Status
             to filter the tournaments.
 
@@ -396,7 +404,9 @@ class TournamentController:
         """
         for round_instance in tournament.rounds:
             if round_instance.round_number == round_number:
-                # Check if there are any unfinished matches in this round
+                # A round not paired yet or with unfinished matches is resumed
+                if not round_instance.matches:
+                    return round_instance
                 for match in round_instance.matches:
                     if not match.finished:
                         return round_instance
@@ -416,12 +426,49 @@ class TournamentController:
             round_instance.create_pairs()
             round_instance.matches = round_instance.pairs
             self.save_tournament_progress(tournament)
+        if any(not match.finished for match in round_instance.matches):
+            self.enter_round_results(round_instance, tournament)
         for match in round_instance.matches:
             if not match.finished:
                 self.play_match(round_instance, match, tournament)
         round_instance.end_time = date_utils.get_current_datetime()
         self.save_tournament_progress(tournament)
 
+    def enter_round_results(self, round_instance, tournament):
+        """
+        Lets the user enter the results of several boards at once, typed as
+        "board:result" entries or loaded from a CSV/JSON file.
+
+        The results are validated together and only applied if they are
+        all valid. They are saved with the round; the boards left without
+        a result are then played match by match.
+
+        Args:
+            round_instance (Round): The current round instance.
+            tournament (Tournament): The tournament instance.
+        """
+        while True:
+            choice = self.tournament_view.prompt_for_result_entry_mode()
+            if choice == "1":
+                return
+            if choice == "2":
+                self.tournament_view.display_round_boards(round_instance)
+                results, errors = result_utils.parse_results_text(
+                    self.tournament_view.get_batch_results())
+            elif choice == "3":
+                results, errors = result_utils.load_results_file(
+                    self.tournament_view.get_results_file_path())
+            else:
+                self.tournament_view.display_feedback("invalid_option")
+                continue
+            errors = round_instance.validate_results(results, errors)
+            if errors:
+                self.tournament_view.display_batch_errors(errors)
+                continue
+            round_instance.apply_results(results)
+            self.tournament_view.display_feedback("batch_results_applied")
+            return
+
     def get_next_match_number(self, round_instance):
         """
         Determines the next match number based on
@@ -470,15 +517,8 @@ class TournamentController:
             tournament (Tournament): The tournament instance containing
             the selected players.
         """
-        # Retrieve player's info and scores
-        player1_info, player2_info = match.match
-        player1_name = (player1_info[0].first_name, player1_info[0].last_name)
-        player2_name = (player2_info[0].first_name, player2_info[0].last_name)
-        score1, score2 = player1_info[1], player2_info[1]
-
-        # Find Player's objects
-        player1 = tournament.find_player_by_name(*player1_name)
-        player2 = tournament.find_player_by_name(*player2_name)
+        player1, player2 = self.get_match_players(tournament, match)
+        score1, score2 = match.match[0][1], match.match[1][1]
 
         # Update player's score
         if player1:
@@ -499,64 +539,31 @@ class TournamentController:
 
     def process_round_results(self, tournament, round_instance):
         """
-        This function retrieves the results of each match in the round,
-        finds the corresponding players based on the match results,
-        and updates their list of opponents.
+        This function finds the players of each match in the round
+        and records the game in their opponents history.
 
         Args:
             tournament (Tournament): The tournament instance.
             round_instance (Round): The round instance to process.
         """
-        for match in round_instance.matches:
-            results = match.get_match_results()
-            player1, player2 = self.get_players_from_results(
-                tournament, results)
-            if not player1 or not player2:
-                self.tournament_view.display_feedback(
-                    "no_players_found")
-                continue
-            player1.add_opponent(player2)
-            player2.add_opponent(player1)
+        for _ in range(round_instance.record_opponents()):
+            self.tournament_view.display_feedback("no_players_found")
 
-    def get_players_from_results(self, tournament, results):
+    def get_match_players(self, tournament, match):
         """
-        Extracts player names from match results and retrieves
-        the corresponding player objects.
+        Retrieves the tournament's Player objects of a match
+        through the tournament's identity map.
 
         Args:
             tournament (Tournament): The tournament instance.
-            results (dict): The match results.
+            match (Match): The match.
 
         Returns:
             tuple: Player objects for the two players in the match,
-            or (None, None) if not found.
-        """
-        try:
-            (player1_name, score1), (player2_name, score2) =\
-                list(results.items())
-        except ValueError:
-            print(f"Erreur dans le format du résultat du match: {results}")
-            return None, None
-
-        player1 = self.find_player_by_name(tournament, player1_name)
-        player2 = self.find_player_by_name(tournament, player2_name)
-
-        return player1, player2
-
-    def find_player_by_name(self, tournament, player_name):
-        """
-        Finds a player in the tournament by their full name.
-
-        Args:
-            tournament (Tournament): The tournament instance.
-            player_name (str): The full name of the player.
-
-        Returns:
-            Player: The matching player, or None if not found.
+            None for a player who is not registered in the tournament.
         """
-        return next((player for player in tournament.selected_players
-                     if f"{player.first_name} {player.last_name}"
-                     == player_name), None)
+        return (tournament.get_player(match.match[0][0].id),
+                tournament.get_player(match.match[1][0].id))
 
     def get_round(self, tournament, round_number):
         """
@@ -730,13 +737,12 @@ class TournamentController:
         Returns:
             None
         """
-        tournaments = Tournament.load_tournaments()
-        tournaments.append(tournament)
-        Tournament.save_tournament(tournaments)
+        Tournament.add_tournament(tournament)
 
     def save_tournament_progress(self, tournament):
         """
         Encapsulates the logic to save the current state of a tournament.
+        The state is written in the background.
 
         Args:
             tournament (Tournament): The tournament instance to save.
@@ -744,4 +750,4 @@ class TournamentController:
         Returns:
             None
         """
-        Tournament.save_tournament_update(tournament)
+        Tournament.save_tournament_progress(tournament)
@@ -1,8 +1,9 @@
+import sys
 
 from controllers.main_controller import MainController
 
 
-def main():
+def run_application():
     try:
         controller = MainController()
         controller.run_main_menu()
@@ -10,5 +11,41 @@ def main():
         print("\nFermeture de l'application...")
 
 
+def main(argv=None):
+    """
+    Starts the application, optionally profiled (--profile) or tracing the
+    memory allocated by the loading of the tournaments and the report
+    generation (--trace-memory).
+
+    Args:
+        argv (list, optional): The arguments. Defaults to sys.argv[1:].
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        run_application()
+        return
+    import argparse
+    parser = argparse.ArgumentParser(description="Gestionnaire de tournois d'échecs.")
+    parser.add_argument("--profile", nargs="?", const="chess_session.prof",
+                        metavar="FICHIER",
+                        help="Profile la session avec cProfile et écrit le profil "
+                             "dans FICHIER (chess_session.prof par défaut).")
+    parser.add_argument("--trace-memory", nargs="?", const=10, type=int,
+                        metavar="N",
+                        help="Affiche les N lignes allouant le plus de mémoire "
+                             "au chargement des tournois et à la génération "
+                             "du rapport (10 par défaut).")
+    args = parser.parse_args(argv)
+    if args.profile or args.trace_memory:
+        from utils import profiling
+        if args.trace_memory:
+            profiling.enable_memory_tracing(args.trace_memory)
+        if args.profile:
+            profiling.run_profiled(run_application, args.profile)
+            return
+    run_application()
+
+
 if __name__ == "__main__":
     main()
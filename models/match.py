@@ -1,20 +1,27 @@
 from models.player import Player
+from utils import instrumentation
 
 
 class Match:
     """
     A class to represent a match between two players in a tournament round.
 
+    The players and their scores are stored as four fixed fields; the
+    match attribute gives the ((player, score), (player, score)) view of
+    them, the first player playing black and the second white.
+
     Attributes:
-        match (list): A list containing two sub-lists,
-        each with a Player object and their score.
-        round_number (int): The number of the round in
-        which this match takes place.
+        match (tuple): Two (Player, score) pairs, read-only.
         finished (bool): A flag indicating whether
         the match has finished.
         in_progress (bool): A flag indicating whether the
         match is currently in progress.
+        version (int): Incremented by every change of the scores or flags,
+        used to detect the matches changed since the last save.
     """
+    __slots__ = ("player1", "player2", "score1", "score2", "finished",
+                 "in_progress", "version")
+
     def __init__(self, player1, player2,
                  finished=False, in_progress=False):
         """
@@ -29,9 +36,18 @@ class Match:
             in_progress (bool): Defaults to False.
             Indicates if the match is in progress.
         """
-        self.match = ([player1, 0], [player2, 0])
+        self.player1 = player1
+        self.player2 = player2
+        self.score1 = 0
+        self.score2 = 0
         self.finished = finished
         self.in_progress = in_progress
+        self.version = 0
+
+    @property
+    def match(self):
+        """tuple: The (player, score) pairs of the first and second players."""
+        return (self.player1, self.score1), (self.player2, self.score2)
 
     def to_dict(self):
         """
@@ -44,35 +60,65 @@ class Match:
         """
         return {
             "match": [
-                {"player": {"id": player[0].id, "last_name": player[0].last_name,
-                            "first_name": player[0].first_name}, "score": player[1]}
-                for player in self.match
+                {"player": {"id": player.id, "last_name": player.last_name,
+                            "first_name": player.first_name}, "score": score}
+                for player, score in ((self.player1, self.score1),
+                                      (self.player2, self.score2))
             ],
             "finished": self.finished,
             "in_progress": self.in_progress
         }
 
     @classmethod
-    def from_dict(cls, data):
+    @instrumentation.timed
+    def from_dict(cls, data, players_by_id=None):
         """
         Create a Match object from a dictionary.
         Used to unserialize data from the database.
 
         Args:
             data (dict): A dictionary containing match information.
+            players_by_id (dict, optional): The tournament's identity map
+            (player id -> Player). Players found in it are shared instead
+            of being rebuilt.
 
         Returns:
             Match: A Match object created from the provided dictionary.
         """
-        players = [Player.from_dict(player_data["player"])
+        players = [cls.resolve_player(player_data["player"], players_by_id)
                    for player_data in data["match"]]
-        match = cls(players[0], players[1], data.get("round_number", 1))
-        match.match[0][1] = data["match"][0]["score"]
-        match.match[1][1] = data["match"][1]["score"]
-        match.finished = data.get("finished", False)
-        match.in_progress = data.get("in_progress", False)
+        match = cls(players[0], players[1], data.get("finished", False),
+                    data.get("in_progress", False))
+        match.score1 = data["match"][0]["score"]
+        match.score2 = data["match"][1]["score"]
         return match
 
+    @staticmethod
+    def resolve_player(player_data, players_by_id):
+        """
+        Finds the Player object referenced by a serialized match.
+
+        Args:
+            player_data (dict): The player reference stored in the match.
+            players_by_id (dict): The tournament's identity map, or None.
+
+        Returns:
+            Player: The shared Player object if the player is known,
+            otherwise a new Player built from the reference.
+        """
+        if players_by_id:
+            player = players_by_id.get(player_data.get("id"))
+            if player is None:
+                # Files saved before player ids were persisted hold stale
+                # ids: fall back to the player's name.
+                player = next((candidate for candidate in players_by_id.values()
+                               if candidate.first_name == player_data.get("first_name")
+                               and candidate.last_name == player_data.get("last_name")),
+                              None)
+            if player is not None:
+                return player
+        return Player.from_dict(player_data)
+
     def set_result(self, score1, score2):
         """
         Set the result of the match by updating the scores of both players.
@@ -82,8 +128,9 @@ class Match:
             score2 (int): The score of the second player.
 
         """
-        self.match[0][1] = score1
-        self.match[1][1] = score2
+        self.score1 = score1
+        self.score2 = score2
+        self.version += 1
 
     def get_match_results(self):
         """
@@ -94,29 +141,27 @@ class Match:
             and their scores as values.
         """
         return {
-            f"{self.match[0][0].first_name} {self.match[0][0].last_name}":
-                self.match[0][1],
-            f"{self.match[1][0].first_name} {self.match[1][0].last_name}":
-                self.match[1][1]
+            f"{self.player1.first_name} {self.player1.last_name}": self.score1,
+            f"{self.player2.first_name} {self.player2.last_name}": self.score2
         }
 
     def update_score(self, result):
         """Updates the score of the match based on the result."""
         if result == 1:
-            self.match[0][1] = 1
-            self.match[1][1] = 0
+            self.score1, self.score2 = 1, 0
         elif result == 2:
-            self.match[1][1] = 1
-            self.match[0][1] = 0
+            self.score1, self.score2 = 0, 1
         elif result == 3:
-            self.match[0][1] = 0.5
-            self.match[1][1] = 0.5
+            self.score1, self.score2 = 0.5, 0.5
+        self.version += 1
 
     def mark_match_as_started(self):
         """Mark the match as in progress."""
         self.in_progress = True
+        self.version += 1
 
     def mark_match_as_finished(self):
         """Marks the match as finished and stops its progress."""
         self.finished = True
         self.in_progress = False
+        self.version += 1
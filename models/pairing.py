@@ -0,0 +1,255 @@
+from utils.matching import max_weight_matching
+
+# NumPy is optional, and imported on the first pairing as its import is slow:
+# pure-Python costs are used when it is not installed.
+numpy = None
+_numpy_imported = False
+
+
+def get_numpy():
+    """
+    Imports NumPy on first call.
+
+    Returns:
+        module: The numpy module, or None if NumPy is not installed.
+    """
+    global numpy, _numpy_imported
+    if not _numpy_imported:
+        _numpy_imported = True
+        try:
+            import numpy as numpy_module
+            numpy = numpy_module
+        except ImportError:
+            numpy = None
+    return numpy
+
+
+class SwissPairing:
+    """
+    Swiss-system pairing engine based on maximum-weight matching.
+
+    Every possible pair of players gets a cost combining the difference of
+    their points, the number of times they already met and how much pairing
+    them would worsen their color balance. The pairing is the perfect
+    matching of minimum total cost, found with Edmonds' blossom algorithm.
+
+    The rematch penalty is larger than any total of the other costs, so a
+    pairing without rematches is always found when one exists.
+
+    When NumPy is installed, the costs of all the pairs are computed at once
+    as an N×N matrix (see cost_matrix); otherwise they are computed pair
+    by pair.
+
+    In a Match, the first player has the black pieces and the second one
+    the white pieces.
+
+    Attributes:
+        players (list): The players to pair, ranked by points.
+        color_balance (dict): Number of games played with white minus
+        number of games played with black, by player id.
+    """
+    SCORE_WEIGHT = 4
+    COLOR_WEIGHT = 1
+    # Players are first only connected to their closest neighbours in the
+    # ranking; wider windows, then the complete graph, are used if that is
+    # not enough to pair everybody without rematches.
+    CANDIDATE_WINDOWS = (12, 48)
+
+    def __init__(self, players, previous_rounds):
+        """
+        Args:
+            players (list): The players to pair.
+            previous_rounds (list): The rounds already played, used to compute
+            the color balances. The encounters come from the players'
+            opponents history.
+        """
+        self.players = sorted(players, key=lambda player: player.total_points,
+                              reverse=True)
+        self.color_balance = {player.id: 0 for player in players}
+        for round_instance in previous_rounds:
+            for match in round_instance.matches:
+                black, white = match.player1.id, match.player2.id
+                if black in self.color_balance:
+                    self.color_balance[black] -= 1
+                if white in self.color_balance:
+                    self.color_balance[white] += 1
+        # Cost matrix, computed on first use when NumPy is available
+        self._costs = None
+
+    def count_encounters(self, player1, player2):
+        """Returns the number of games played by the two players together."""
+        return player1.count_encounters(player2)
+
+    def pairing_cost(self, player1, player2):
+        """
+        Computes the cost of pairing two players, without the rematch penalty.
+
+        The score term grows with the square of the points difference, so
+        pairing within the same point group is preferred over spreading
+        the difference over several boards.
+
+        Args:
+            player1 (Player): The first player.
+            player2 (Player): The second player.
+
+        Returns:
+            int: The cost of the pair.
+        """
+        # Points are multiples of 0.5: doubled to work with integers
+        score_difference = round(2 * abs(player1.total_points - player2.total_points))
+        cost = self.SCORE_WEIGHT * score_difference * score_difference
+        balance1 = self.color_balance[player1.id]
+        balance2 = self.color_balance[player2.id]
+        if (balance1 > 0 and balance2 > 0) or (balance1 < 0 and balance2 < 0):
+            # Both players are due the same color: one of them won't get it
+            cost += self.COLOR_WEIGHT * min(abs(balance1), abs(balance2))
+        return cost
+
+    def rematch_penalty(self):
+        """
+        Returns the cost of a single rematch, larger than the sum of the other
+        costs of any pairing.
+        """
+        if len(self.players) < 2:
+            return 1
+        max_score_difference = round(2 * (self.players[0].total_points
+                                          - self.players[-1].total_points))
+        max_balance = max(abs(balance) for balance in self.color_balance.values())
+        max_cost = (self.SCORE_WEIGHT * max_score_difference * max_score_difference
+                    + self.COLOR_WEIGHT * max_balance)
+        return (len(self.players) // 2) * max_cost + 1
+
+    def cost_matrix(self):
+        """
+        Computes the costs of all the pairs at once, rematch penalty included,
+        with NumPy. Requires NumPy.
+
+        Returns:
+            numpy.ndarray: The N×N matrix of the pairing costs, indexed by
+            ranking indices.
+        """
+        player_count = len(self.players)
+        index = {player.id: i for i, player in enumerate(self.players)}
+        points = numpy.rint(numpy.array(
+            [2 * player.total_points for player in self.players])).astype(numpy.int64)
+        score_difference = numpy.abs(points[:, None] - points[None, :])
+        costs = self.SCORE_WEIGHT * score_difference * score_difference
+        balances = numpy.array([self.color_balance[player.id]
+                                for player in self.players], dtype=numpy.int64)
+        same_color_due = (balances[:, None] * balances[None, :]) > 0
+        costs += (self.COLOR_WEIGHT * same_color_due
+                  * numpy.minimum(numpy.abs(balances)[:, None],
+                                  numpy.abs(balances)[None, :]))
+        encounters = numpy.zeros((player_count, player_count), dtype=numpy.int64)
+        for i, player in enumerate(self.players):
+            for opponent_id, count in player.opponents.items():
+                if opponent_id in index:
+                    encounters[i, index[opponent_id]] = count
+        costs += self.rematch_penalty() * encounters
+        return costs
+
+    def build_edges(self, window):
+        """
+        Builds the weighted edges of the pairing graph.
+
+        Args:
+            window (int): Each player is connected to the next `window` players
+            in the ranking, or None to build the complete graph.
+
+        Returns:
+            list: A list of (i, j, weight) tuples, i and j being ranking indices.
+        """
+        if get_numpy() is not None:
+            return self.build_edges_from_matrix(window)
+        player_count = len(self.players)
+        penalty = self.rematch_penalty()
+        costs = []
+        for i in range(player_count):
+            if window is None:
+                last = player_count
+            else:
+                last = min(player_count, i + window + 1)
+            for j in range(i + 1, last):
+                player1, player2 = self.players[i], self.players[j]
+                cost = (self.pairing_cost(player1, player2)
+                        + penalty * self.count_encounters(player1, player2))
+                costs.append((i, j, cost))
+        # The matching maximizes weights: weights decrease with the cost
+        max_cost = max((cost for _, _, cost in costs), default=0)
+        return [(i, j, max_cost - cost + 1) for i, j, cost in costs]
+
+    def build_edges_from_matrix(self, window):
+        """
+        Builds the weighted edges of the pairing graph from the cost matrix.
+
+        Args:
+            window (int): The candidate window, or None for the complete graph.
+
+        Returns:
+            list: A list of (i, j, weight) tuples, i and j being ranking indices.
+        """
+        if self._costs is None:
+            self._costs = self.cost_matrix()
+        rows, columns = numpy.triu_indices(len(self.players), 1)
+        if window is not None:
+            in_window = columns - rows <= window
+            rows, columns = rows[in_window], columns[in_window]
+        costs = self._costs[rows, columns]
+        if not len(costs):
+            return []
+        weights = costs.max() - costs + 1
+        return list(zip(rows.tolist(), columns.tolist(), weights.tolist()))
+
+    def find_matching(self, window):
+        """
+        Computes the minimum-cost perfect matching of the pairing graph.
+
+        Args:
+            window (int): The candidate window, or None for the complete graph.
+
+        Returns:
+            list: mate[i] is the ranking index of the opponent of player i,
+            or -1 if the player is left unpaired.
+        """
+        mate = max_weight_matching(self.build_edges(window), max_cardinality=True)
+        return mate + [-1] * (len(self.players) - len(mate))
+
+    def is_acceptable(self, mate):
+        """Checks that a matching pairs everybody without avoidable rematches."""
+        return all(opponent >= 0 and not self.count_encounters(
+            self.players[i], self.players[opponent])
+            for i, opponent in enumerate(mate))
+
+    def pair(self):
+        """
+        Computes the pairing of the round.
+
+        Returns:
+            list: A list of (black, white) player tuples, by decreasing points.
+        """
+        if len(self.players) < 2:
+            return []
+        for window in self.CANDIDATE_WINDOWS:
+            mate = self.find_matching(window)
+            if self.is_acceptable(mate):
+                break
+        else:
+            mate = self.find_matching(None)
+        pairs = []
+        for i, opponent in enumerate(mate):
+            if opponent > i:
+                pairs.append(self.assign_colors(self.players[i],
+                                                self.players[opponent]))
+        return pairs
+
+    def assign_colors(self, player1, player2):
+        """
+        Orders a pair as (black, white): the player who played white the most
+        gets black. On equal balances, the higher-ranked player gets white.
+
+        Returns:
+            tuple: The (black, white) players.
+        """
+        if self.color_balance[player1.id] > self.color_balance[player2.id]:
+            return player1, player2
+        return player2, player1
@@ -1,14 +1,17 @@
-import uuid
-import os
+import csv
 import json
+import os
+import uuid
+from collections import Counter
 
-from utils import text_utils, date_utils
+from storage.repository import get_repository, get_player_cache
+from utils import instrumentation, text_utils, date_utils
 
 
 class Player:
     """
     Represents a player in the tournament system, including personal details,
-    tournament points, and their list of opponents.
+    tournament points, and their history of opponents.
 
     Attributes:
         last_name (str): The player's last name.
@@ -16,21 +19,25 @@ class Player:
         date_of_birth (str): The player's date of birth.
         national_id (str): The player's national identification number.
         total_points (int): The player's total points in the tournament.
-        opponents (list): A list of opponents the player has faced.
+        opponents (Counter): Number of games played against each opponent,
+        by opponent id. Only meaningful within a tournament.
         id (str): A unique identifier for the player.
+        version (int): Incremented by every change of the points or
+        opponents, used to detect the players changed since the last save.
     """
-    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    PLAYERS_FILE = os.path.join(BASE_DIR, "data", "players.json")
+    __slots__ = ("id", "last_name", "first_name", "date_of_birth", "national_id",
+                 "total_points", "opponents", "version")
 
     def __init__(self, last_name, first_name, date_of_birth,
-                 national_id, total_points=0):
-        self.id = str(uuid.uuid4())
+                 national_id, total_points=0, player_id=None):
+        self.id = player_id or str(uuid.uuid4())
         self.last_name = last_name
         self.first_name = first_name
         self.date_of_birth = date_of_birth
         self.national_id = national_id
         self.total_points = total_points
-        self.opponents = []
+        self.opponents = Counter()
+        self.version = 0
 
     def __lt__(self, other):
         """
@@ -70,6 +77,7 @@ class Player:
     def from_dict(cls, data):
         """
         Creates a Player object from a dictionary.
+        The stored id is kept, a new one is generated only if it is missing.
 
         Args:
             data (dict): A dictionary containing player data.
@@ -82,18 +90,19 @@ class Player:
             data.get("first_name", "Unknown"),
             data.get("date_of_birth", "01/01/1900"),
             data.get("national_id", "000000"),
-            data.get("total_points", 0)
+            data.get("total_points", 0),
+            data.get("id")
         )
 
     def add_opponent(self, opponent):
         """
-        Adds an opponent to the player's list of opponents, if not already present.
+        Records a game played against an opponent.
 
         Args:
             opponent (Player): The opponent to add.
         """
-        if opponent not in self.opponents:
-            self.opponents.append(opponent)
+        self.opponents[opponent.id] += 1
+        self.version += 1
 
     def has_played_against(self, opponent):
         """
@@ -105,50 +114,97 @@ class Player:
        Returns:
            bool: True if the player has played against the opponent, False otherwise.
        """
-        return opponent in self.opponents
+        return opponent.id in self.opponents
 
-    @staticmethod
-    def check_for_data_directory():
+    def count_encounters(self, opponent):
         """
-        Ensures the data directory for storing player information exists.
-        If the directory doesn't exist, it is created.
+        Returns the number of games played against a specified opponent.
+
+        Args:
+            opponent (Player): The opponent to check.
+
+        Returns:
+            int: The number of games played together.
         """
-        if not os.path.exists(os.path.dirname(Player.PLAYERS_FILE)):
-            os.makedirs(os.path.dirname(Player.PLAYERS_FILE))
+        return self.opponents.get(opponent.id, 0)
 
     @classmethod
+    @instrumentation.timed
     def load_players(cls):
         """
-        Loads the list of players from the JSON file.
+        Loads the list of players from the storage backend. The players are
+        read from the store only when it changed since the previous call
+        (see PlayerCache); new Player objects are built on every call.
 
         Returns:
-            list: A list of Player objects, or an empty list if no file is found.
+            list: A list of Player objects, or an empty list if no player is stored.
+        """
+        return [cls.from_dict(player) for player in get_player_cache().load_players()]
 
-        If the file does not exist, it is created and an empty list is returned.
+    @classmethod
+    def load_player(cls, player_id):
         """
-        cls.check_for_data_directory()
-        if not os.path.exists(cls.PLAYERS_FILE):
-            with open(cls.PLAYERS_FILE, 'w', encoding='utf-8') as file:
-                json.dump([], file)
-            return []
-        with open(cls.PLAYERS_FILE, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            return [cls.from_dict(player) for player in data]
+        Loads a registered player by id.
+
+        Args:
+            player_id (str): The player id.
+
+        Returns:
+            Player: The player, or None if no player has this id.
+        """
+        player_data = get_player_cache().get_player(player_id)
+        return cls.from_dict(player_data) if player_data else None
 
     @classmethod
+    def find_by_national_id(cls, national_id):
+        """
+        Looks up a registered player through the national ID index.
+
+        Args:
+            national_id (str): The national ID, in any case.
+
+        Returns:
+            Player: The player, or None if the national ID is not registered.
+        """
+        player_id = get_player_cache().index.find_national_id(national_id)
+        return cls.load_player(player_id) if player_id else None
+
+    @classmethod
+    def search_players(cls, query):
+        """
+        Searches the registered players through the secondary indexes: by
+        national ID if the query is one, by year of birth if it is a
+        4-digit year, and otherwise by last name prefix.
+
+        Args:
+            query (str): The national ID, year or beginning of last name.
+
+        Returns:
+            list: The matching Player objects, in alphabetical order.
+        """
+        query = query.strip()
+        index = get_player_cache().index
+        if cls.validate_national_id(query):
+            player_id = index.find_national_id(query)
+            player_ids = [player_id] if player_id else []
+        elif len(query) == 4 and query.isdigit():
+            player_ids = index.find_birth_year(query)
+        else:
+            player_ids = index.search_last_name(query)
+        players = [cls.load_player(player_id) for player_id in player_ids]
+        return sorted((player for player in players if player),
+                      key=lambda player: player.last_name)
+
+    @classmethod
+    @instrumentation.timed
     def save_players(cls, players):
         """
-        Saves the list of players to the JSON file.
+        Saves the list of players to the storage backend.
 
         Args:
             players (list): A list of Player objects to be saved.
-
-        The data directory is created if it does not exist.
         """
-        cls.check_for_data_directory()
-        with open(cls.PLAYERS_FILE, 'w', encoding='utf-8') as file:
-            json.dump([player.to_dict() for player in players], file,
-                      ensure_ascii=False, indent=4)
+        get_player_cache().save_players([player.to_dict() for player in players])
 
     @classmethod
     def sort_players_alphabetically(cls):
@@ -173,17 +229,17 @@ class Player:
             score (float): The score to add to the player's total points.
         """
         self.total_points += score
+        self.version += 1
 
     @classmethod
     def players_file_exists(cls):
-        """Checks if the players file exists."""
-        return os.path.exists(cls.PLAYERS_FILE)
+        """Checks if the players file (or database) exists."""
+        return get_repository().players_store_exists()
 
     @classmethod
     def has_enough_players(cls, min_players=2):
         """Checks if there are enough players."""
-        players = cls.load_players()
-        return len(players) >= min_players
+        return get_player_cache().count_players() >= min_players
 
     @classmethod
     def add_new_player(cls, new_player):
@@ -198,21 +254,193 @@ class Player:
         players.append(new_player)
         cls.save_players(players)
 
+    @classmethod
+    def add_new_players(cls, new_players):
+        """
+        Adds several new players to the player list, saved in a single write.
+
+        Args:
+            new_players (list): The new players to add.
+        """
+        players = cls.load_players()
+        players.extend(new_players)
+        cls.save_players(players)
+
+    @staticmethod
+    def iter_import_rows(file_path):
+        """
+        Reads the players of an import file one line at a time.
+
+        A CSV file has a header line naming the columns last_name, first_name,
+        date_of_birth and national_id. A JSONL file holds one JSON object with
+        the same keys per line; blank lines are ignored. A JSON file holding
+        a list of such objects is also accepted, but is read at once.
+
+        Args:
+            file_path (str): The path of the CSV, JSONL or JSON file.
+
+        Yields:
+            tuple: The position of the row in the file (e.g. "Ligne 3"), and
+            the row as a dictionary, or None with an error message if the
+            row cannot be read.
+
+        Raises:
+            ValueError: If the file format is not supported, or a JSON file
+            is not a list.
+            OSError: If the file cannot be opened.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in (".csv", ".jsonl", ".json"):
+            raise ValueError("Format de fichier non pris en charge "
+                             "(CSV, JSONL ou JSON attendu).")
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as file:
+            if extension == ".csv":
+                reader = csv.DictReader(file)
+                for row in reader:
+                    yield f"Ligne {reader.line_num}", row, None
+                return
+            if extension == ".json":
+                rows = json.load(file)
+                if not isinstance(rows, list):
+                    raise ValueError("Une liste de joueurs est attendue.")
+                rows = ((f"Joueur {number}", row, None)
+                        for number, row in enumerate(rows, start=1))
+            else:
+                rows = (Player.parse_jsonl_line(f"Ligne {number}", line)
+                        for number, line in enumerate(file, start=1)
+                        if line.strip())
+            for position, row, error in rows:
+                if error is None and not isinstance(row, dict):
+                    row, error = None, "objet JSON attendu."
+                yield position, row, error
+
+    @staticmethod
+    def parse_jsonl_line(position, line):
+        """
+        Parses a line of a JSONL import file.
+
+        Args:
+            position (str): The position of the line in the file.
+            line (str): The line.
+
+        Returns:
+            tuple: The position, the parsed value, or None with an error
+            message if the line is not valid JSON.
+        """
+        try:
+            return position, json.loads(line), None
+        except ValueError:
+            return position, None, "JSON invalide."
+
+    @classmethod
+    def from_import_row(cls, row):
+        """
+        Creates a new player from a row of an import file, normalized like
+        the players entered in the menu.
+
+        Args:
+            row (dict): The player data, with string values.
+
+        Returns:
+            tuple: The Player object, or None with an error message if the
+            row is invalid.
+        """
+        last_name = str(row.get("last_name") or "").strip().upper()
+        first_name = str(row.get("first_name") or "").strip().capitalize()
+        date_of_birth = str(row.get("date_of_birth") or "").strip()
+        national_id = str(row.get("national_id") or "").strip().upper()
+        if not last_name or not first_name:
+            return None, "nom et prénom obligatoires."
+        if not date_utils.validate_date(date_of_birth):
+            return None, "date de naissance invalide (JJ/MM/AAAA attendu)."
+        if not text_utils.validate_national_id(national_id):
+            return None, "identifiant national invalide."
+        return cls(last_name, first_name, date_of_birth, national_id), None
+
+    @classmethod
+    def import_players(cls, file_path):
+        """
+        Registers the players of a CSV, JSONL or JSON file.
+
+        The file is read line by line and each row is validated. A player
+        whose national ID is already registered (looked up in the national
+        ID index), or appears on a previous line, is rejected. The valid
+        players are saved in a single write, even if other lines have errors.
+
+        Args:
+            file_path (str): The path of the CSV, JSONL or JSON file.
+
+        Returns:
+            tuple: The list of the imported players, and the list of the
+            error messages, one per rejected row.
+
+        Raises:
+            ValueError: If the file format is not supported.
+            OSError: If the file cannot be read.
+        """
+        index = get_player_cache().index
+        # National IDs of the players imported so far from the file
+        national_ids = set()
+        imported_players = []
+        errors = []
+        for position, row, error in cls.iter_import_rows(file_path):
+            if row is not None:
+                player, error = cls.from_import_row(row)
+            if not error and (player.national_id in national_ids
+                              or index.find_national_id(player.national_id)):
+                error = f"identifiant national {player.national_id} déjà utilisé."
+            if error:
+                errors.append(f"{position} : {error}")
+                continue
+            national_ids.add(player.national_id)
+            imported_players.append(player)
+        if imported_players:
+            cls.add_new_players(imported_players)
+        return imported_players, errors
+
     @classmethod
     def delete_players(cls, players, selected_players):
         """
         Deletes the selected players from the player list and saves the updated list.
 
+        The list is filtered in place in a single pass, keyed by the ids of
+        the selected players, so its order (e.g. alphabetical) is kept and
+        it does not need to be reloaded.
+
         Args:
-            players_to_delete (list): List of players to delete.
+            players (list): The list of all the registered players.
+            selected_players (list): List of players to delete.
 
         Raises:
             IOError: If there is an error accessing the database.
         """
-        for player in selected_players:
-            players.remove(player)
+        selected_ids = {player.id for player in selected_players}
+        players[:] = [player for player in players if player.id not in selected_ids]
         cls.save_players(players)
 
+    @classmethod
+    def delete_players_where(cls, predicate, dry_run=False):
+        """
+        Deletes every registered player matching a condition, in a single
+        pass and a single write, e.g. to prune inactive players.
+
+        Args:
+            predicate (callable): Returns True for a Player object to delete.
+            dry_run (bool): If True, the matching players are returned but
+            not deleted.
+
+        Returns:
+            list: The deleted (or matching) players.
+        """
+        players = cls.load_players()
+        kept_players = []
+        deleted_players = []
+        for player in players:
+            (deleted_players if predicate(player) else kept_players).append(player)
+        if deleted_players and not dry_run:
+            cls.save_players(kept_players)
+        return deleted_players
+
     @staticmethod
     def validate_national_id(national_id):
         """
@@ -1,5 +1,7 @@
 import random
 from models.match import Match
+from models.pairing import SwissPairing
+from utils import instrumentation
 
 
 class Round:
@@ -8,6 +10,7 @@ class Round:
     managing matches, and tracking the start and end times.
 
     Attributes:
+        tournament (Tournament): The tournament the round belongs to.
         players (list): The list of players in the tournament.
         pairs (list): The list of player pairs for the round.
         round_number (int): The round number in the tournament.
@@ -15,9 +18,22 @@ class Round:
         is_first_round (bool): Indicates if the round is the first in the tournament.
         start_time (str): The start time of the round.
         end_time (str): The end time of the round.
+
+    Setting the matches, start time or end time increments the round's
+    version, used with the versions of its matches to detect the rounds
+    changed since the last save.
     """
+    __slots__ = ("version", "_serialized", "_serialized_version", "tournament",
+                 "players", "pairs", "round_number", "_matches", "is_first_round",
+                 "_start_time", "_end_time")
+
     def __init__(self, tournament, round_number, matches=None,
                  is_first_round=False, start_time=None, end_time=None):
+        self.version = 0
+        # Serialized round and the state version it was built from
+        self._serialized = None
+        self._serialized_version = None
+        self.tournament = tournament
         self.players = tournament.selected_players
         self.pairs = []
         self.round_number = round_number
@@ -26,19 +42,64 @@ class Round:
         self.start_time = start_time
         self.end_time = end_time
 
+    @property
+    def matches(self):
+        """The list of Match objects in the round."""
+        return self._matches
+
+    @matches.setter
+    def matches(self, matches):
+        self._matches = matches
+        self.version += 1
+
+    @property
+    def start_time(self):
+        """The start time of the round."""
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, start_time):
+        self._start_time = start_time
+        self.version += 1
+
+    @property
+    def end_time(self):
+        """The end time of the round."""
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, end_time):
+        self._end_time = end_time
+        self.version += 1
+
+    def state_version(self):
+        """
+        Returns a number that increases whenever the round or one of its
+        matches changes.
+        """
+        return self.version + sum(match.version for match in self.matches)
+
     def to_dict(self):
         """
         Converts the Round object into a dictionary for serialization.
 
+        The dictionary is reused while the round is unchanged, so only
+        the rounds changed since the previous call are serialized again.
+        It must not be modified.
+
         Returns:
             dict: A dictionary representation of the round's data.
         """
-        return {
-            "round_number": self.round_number,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "matches": [match.to_dict() for match in self.matches]
-        }
+        version = self.state_version()
+        if self._serialized is None or self._serialized_version != version:
+            self._serialized = {
+                "round_number": self.round_number,
+                "start_time": self.start_time,
+                "end_time": self.end_time,
+                "matches": [match.to_dict() for match in self.matches]
+            }
+            self._serialized_version = version
+        return self._serialized
 
     @classmethod
     def from_dict(cls, data, tournament):
@@ -52,19 +113,83 @@ class Round:
         Returns:
             Round: A Round instance initialized with the given data.
         """
-        matches = [Match.from_dict(match_data) for match_data
+        players_by_id = tournament.players_by_id
+        matches = [Match.from_dict(match_data, players_by_id) for match_data
                    in data["matches"]]
         start_time = data.get("start_time")
         end_time = data.get("end_time")
         round_instance = cls(tournament, data["round_number"], matches,
                              start_time=start_time, end_time=end_time)
-        # Restore pairs if they exist
-        if "pairs" in data:
-            round_instance.pairs = [Match.from_dict(match_data)
+        # Restore pairs if they exist, sharing the matches they pair
+        if data.get("pairs") == data["matches"]:
+            round_instance.pairs = matches
+        elif "pairs" in data:
+            round_instance.pairs = [Match.from_dict(match_data, players_by_id)
                                     for match_data in data["pairs"]]
 
         return round_instance
 
+    def validate_results(self, results, parse_errors=()):
+        """
+        Checks that results can be applied to the boards of the round.
+
+        Args:
+            results (dict): The results by board number (starting at 1).
+            parse_errors (list, optional): The errors met while reading the
+            results, reported first.
+
+        Returns:
+            list: The error messages, empty if the results are valid.
+        """
+        errors = list(parse_errors)
+        if not results and not errors:
+            errors.append("Aucun résultat saisi.")
+        for board in sorted(results):
+            if not 1 <= board <= len(self.matches):
+                errors.append(f"Échiquier {board} : ce round compte "
+                              f"{len(self.matches)} échiquiers.")
+            elif self.matches[board - 1].finished:
+                errors.append(f"Échiquier {board} : le match est déjà terminé.")
+        return errors
+
+    def apply_results(self, results):
+        """
+        Applies validated results to the matches of the round and to the
+        total points of the tournament's players, without saving.
+
+        Args:
+            results (dict): The results by board number (starting at 1).
+        """
+        for board, result in sorted(results.items()):
+            match = self.matches[board - 1]
+            match.update_score(result)
+            for player, score in match.match:
+                tournament_player = self.tournament.get_player(player.id)
+                if tournament_player:
+                    tournament_player.update_player_total_points(score)
+            match.mark_match_as_finished()
+
+    def record_opponents(self):
+        """
+        Records the games of the round in the opponents history of the
+        tournament's players.
+
+        Returns:
+            int: The number of matches whose players are not registered in
+            the tournament, and were not recorded.
+        """
+        missing = 0
+        for match in self.matches:
+            player1 = self.tournament.get_player(match.player1.id)
+            player2 = self.tournament.get_player(match.player2.id)
+            if not player1 or not player2:
+                missing += 1
+                continue
+            player1.add_opponent(player2)
+            player2.add_opponent(player1)
+        return missing
+
+    @instrumentation.timed
     def create_pairs(self):
         """
         Creates player pairs for the round.
@@ -89,128 +214,17 @@ class Round:
 
     def create_pairs_based_on_points(self):
         """
-        Creates player pairs based on their total points in descending order.
+        Creates player pairs based on their total points.
 
-        Players with similar points are paired together.
-        f no suitable opponent is found in the same group,
-        lower point groups are considered.
+        The pairing is computed by the SwissPairing engine: players with
+        similar points are paired together, rematches are avoided whenever
+        possible and color balances are taken into account.
         """
         # Sort players by total points in descending order
         self.players.sort(key=lambda player: player.total_points,
                           reverse=True)
-
-        # Group players by total points
-        grouped_players = {}
-        for player in self.players:
-            points = player.total_points
-            if points not in grouped_players:
-                grouped_players[points] = []
-            grouped_players[points].append(player)
-
-        # Prepare the list of pairs
+        previous_rounds = [round_instance for round_instance in self.tournament.rounds
+                           if round_instance.round_number < self.round_number]
         self.pairs = []
-
-        # Pair players with similar points
-        available_players = self.players[:]
-        while len(available_players) >= 2:
-            player1 = available_players.pop(0)
-
-            # Get a list of players with the same or
-            # close points (up to one group lower if needed)
-            possible_opponents = (
-                self.get_possible_opponents(player1,
-                                            grouped_players, available_players))
-
-            # Find the best opponent among the possible ones
-            player2 = self.find_best_opponent(player1, possible_opponents)
-            if player2:
-                match = Match(player1, player2)
-                self.pairs.append(match)
-                player1.add_opponent(player2)
-                player2.add_opponent(player1)
-                available_players.remove(player2)
-            else:
-                raise Exception("Aucun adversaire trouvé")
-
-    def get_possible_opponents(self, player1, grouped_players, available_players):
-        """
-        Retrieves a list of possible opponents for a player based on their points.
-
-        Args:
-            player1 (Player): The player for whom to find opponents.
-            grouped_players (dict): A dictionary grouping players by points.
-            available_players (list): The list of players available for pairing.
-
-        Returns:
-            list: A list of possible opponents.
-        """
-        # Get the total points of player1
-        player1_points = player1.total_points
-
-        # Start with players with the same points
-        possible_opponents = grouped_players.get(player1_points, [])
-        possible_opponents = [player for player in possible_opponents
-                              if player in available_players]
-
-        # If enough opponents exist in the same group, don't look further
-        if len(possible_opponents) >= 2:
-            return possible_opponents
-
-        # Iteratively consider players in the next lower groups if not enough opponents
-        current_points = player1_points
-        while len(possible_opponents) < 2:
-            next_lower_points = self.get_next_lower_points(grouped_players,
-                                                           current_points)
-            if next_lower_points is None:
-                break  # No more lower groups available
-            possible_opponents.extend(
-                [player for player in grouped_players[next_lower_points]
-                 if player in available_players]
-            )
-            current_points = next_lower_points
-
-        return possible_opponents
-
-    def get_next_lower_points(self, grouped_players, current_points):
-        """
-        Finds the next lower point group for pairing.
-
-        Args:
-            grouped_players (dict): A dictionary grouping players by points.
-            current_points (int): The current point group of the player.
-
-        Returns:
-            int: The next lower point group or None if no lower group exists.
-        """
-        sorted_points = sorted(grouped_players.keys(), reverse=True)
-        current_index = sorted_points.index(current_points)
-        if current_index + 1 < len(sorted_points):
-            return sorted_points[current_index + 1]
-        return None
-
-    def find_best_opponent(self, player1, possible_opponents):
-        """
-        Finds the best opponent for a player who has not played against them.
-
-        Args:
-            player1 (Player): The player for whom to find an opponent.
-            possible_opponents (list): A list of potential opponents.
-
-        Returns:
-            Player: The best available opponent, or
-            None if no suitable opponent is found.
-        """
-        for player2 in possible_opponents:
-            if not player1.has_played_against(player2):
-                return player2
-        # If all possible opponents have played against player1,
-        # return the one with the fewest encounters
-        min_encounters = min(player1.opponents.count(player2) for
-                             player2 in possible_opponents)
-
-        # Filter the opponents to those with the minimum number of encounters
-        best_candidates = [player2 for player2 in possible_opponents if
-                           player1.opponents.count(player2) == min_encounters]
-
-        # Select randomly among the best candidates
-        return random.choice(best_candidates)
+        for player1, player2 in SwissPairing(self.players, previous_rounds).pair():
+            self.pairs.append(Match(player1, player2))
@@ -1,15 +1,19 @@
 import uuid
-import os
 import json
+from collections import Counter
+from datetime import datetime
 
-from utils import date_utils
+from utils import date_utils, instrumentation, profiling
 from models.round import Round
 from models.player import Player
+from storage.repository import get_repository, get_writer, flush_writes
 
 
 class Tournament:
-    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    TOURNAMENTS_FILE = os.path.join(BASE_DIR, "data", "tournaments.json")
+    __slots__ = ("version", "saved_version", "reference", "name", "location",
+                 "start_date", "end_date", "number_of_rounds", "number_of_players",
+                 "_description", "_rounds_completed", "_in_progress",
+                 "selected_players", "players_by_id", "_rounds", "_rounds_data")
 
     def __init__(self, name: str, location: str, start_date: str,
                  end_date: str, number_of_rounds: int,
@@ -34,6 +38,9 @@ class Tournament:
         Raises:
             ValueError: If number_of_rounds or number_of_players is negative.
         """
+        self.version = 0
+        # State version of the last save, None if the tournament was never saved
+        self.saved_version = None
         self.reference = str(uuid.uuid4())
         self.name = name
         self.location = location
@@ -45,16 +52,106 @@ class Tournament:
         self.rounds_completed = rounds_completed
         self.in_progress = in_progress
         self.selected_players = []
+        # Identity map shared by the rounds and matches: player id -> Player
+        self.players_by_id = {}
+        # Serialized rounds not built yet, see the rounds property
+        self._rounds_data = None
         self.rounds = []
 
+    @property
+    def description(self):
+        """A brief description of the tournament."""
+        return self._description
+
+    @description.setter
+    def description(self, description):
+        self._description = description
+        self.version += 1
+
+    @property
+    def rounds_completed(self):
+        """Whether all the rounds have been played."""
+        return self._rounds_completed
+
+    @rounds_completed.setter
+    def rounds_completed(self, rounds_completed):
+        self._rounds_completed = rounds_completed
+        self.version += 1
+
+    @property
+    def in_progress(self):
+        """Whether the tournament is in progress."""
+        return self._in_progress
+
+    @in_progress.setter
+    def in_progress(self, in_progress):
+        self._in_progress = in_progress
+        self.version += 1
+
+    @property
+    def rounds(self):
+        """
+        The Round objects of the tournament. The rounds of a loaded
+        tournament are built from their serialized form on first access, so
+        that listing or filtering tournaments does not build their matches.
+        """
+        if self._rounds is None:
+            self.hydrate_rounds()
+        return self._rounds
+
+    @rounds.setter
+    def rounds(self, rounds):
+        self._rounds = rounds
+        self._rounds_data = None
+
+    def hydrate_rounds(self):
+        """
+        Builds the Round and Match objects from the serialized rounds kept
+        by from_dict. A tournament unchanged since it was saved stays so.
+        """
+        saved = not self.is_dirty()
+        self._rounds = [Round.from_dict(round_data, self)
+                        for round_data in self._rounds_data]
+        self._rounds_data = None
+        if saved:
+            self.mark_as_saved()
+
+    def state_version(self):
+        """
+        Returns a number that increases whenever the tournament, one of its
+        rounds, matches or players changes. Used to skip the saves of
+        unchanged tournaments.
+        """
+        if self._rounds is None:
+            # The rounds cannot have changed before being built
+            return (self.version + len(self._rounds_data)
+                    + sum(player.version for player in self.selected_players))
+        return (self.version + len(self.rounds)
+                + sum(round_instance.state_version() for round_instance in self.rounds)
+                + sum(player.version for player in self.selected_players))
+
+    def is_dirty(self):
+        """Checks if the tournament changed since it was last saved or loaded."""
+        return self.saved_version != self.state_version()
+
+    def mark_as_saved(self):
+        """Records the current state of the tournament as saved."""
+        self.saved_version = self.state_version()
+
     def to_dict(self):
         """
         Converts the Tournament instance to a dictionary representation.
 
         Returns:
             dict: A dictionary containing the tournament details,
-            including players and rounds.
+            including players and rounds. Each selected player also holds
+            its opponents history within the tournament. Rounds which
+            were never built are returned as they were loaded.
         """
+        if self._rounds is None:
+            rounds = list(self._rounds_data)
+        else:
+            rounds = [round.to_dict() for round in self._rounds]
         return {
             "reference": self.reference,
             "name": self.name,
@@ -66,16 +163,21 @@ class Tournament:
             "description": self.description,
             "rounds_completed": self.rounds_completed,
             "in_progress": self.in_progress,
-            "selected_players": [player.to_dict() for player
-                                 in self.selected_players],
-            "rounds": [round.to_dict() for round in self.rounds]
+            "selected_players": [{**player.to_dict(),
+                                  "opponents": dict(player.opponents)}
+                                 for player in self.selected_players],
+            "rounds": rounds
         }
 
     @classmethod
+    @instrumentation.timed
     def from_dict(cls, data):
         """
         Creates a Tournament object from a dictionary. This method also converts
-        player and round data from dictionaries into their respective objects.
+        player data from dictionaries into Player objects. The rounds are
+        kept serialized and built on first access to the rounds attribute;
+        their matches share the tournament's Player objects through its
+        identity map.
 
         Args:
             data (dict): A dictionary containing the tournament data.
@@ -95,11 +197,19 @@ class Tournament:
             data.get("in_progress", "False")
         )
         tournament.reference = data.get("reference", str(uuid.uuid4()))
-        tournament.selected_players = \
-            [Player.from_dict(player_data) for player_data
-             in data.get("selected_players", [])]
-        tournament.rounds = [Round.from_dict(round_data, tournament)
-                             for round_data in data.get("rounds", [])]
+        players = []
+        for player_data in data.get("selected_players", []):
+            player = Player.from_dict(player_data)
+            player.opponents = Counter(player_data.get("opponents", {}))
+            players.append(player)
+        tournament.assign_players(players)
+        tournament._rounds = None
+        tournament._rounds_data = data.get("rounds", [])
+        if any("opponents" not in player_data
+               for player_data in data.get("selected_players", [])):
+            # Saved before the opponents history was stored
+            tournament.rebuild_opponents_history()
+        tournament.mark_as_saved()
         return tournament
 
     @classmethod
@@ -122,19 +232,10 @@ class Tournament:
         return cls(name, location, start_date, end_date, number_of_rounds,
                    number_of_players)
 
-    @staticmethod
-    def check_for_data_directory():
-        """
-        Ensures the data directory for storing tournaments exists.
-        If the directory doesn't exist, it is created.
-        """
-        if not os.path.exists(os.path.dirname(Tournament.TOURNAMENTS_FILE)):
-            os.makedirs(os.path.dirname(Tournament.TOURNAMENTS_FILE))
-
     @classmethod
     def load_tournaments(cls):
         """
-        Loads the list of tournaments from the JSON file.
+        Loads the list of tournaments from the storage backend.
 
         Returns:
             list: A list of Tournament objects, or an empty list if no file is found.
@@ -143,36 +244,138 @@ class Tournament:
             Handles FileNotFoundError and JSONDecodeError,
             returning an empty list on failure.
         """
-        cls.check_for_data_directory()
-        if not os.path.exists(cls.TOURNAMENTS_FILE):
+        try:
+            flush_writes()
+            data = get_repository().load_tournaments()
+            return [cls.from_dict(tournament) for tournament in data]
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Erreur lors du chargement des tournois : {e}")
             return []
+
+    @classmethod
+    @instrumentation.timed
+    @profiling.traced_memory
+    def load_tournament_summaries(cls):
+        """
+        Loads the summaries of all tournaments, without their players
+        and rounds. Used to list and filter tournaments.
+
+        Returns:
+            list: A list of TournamentSummary objects.
+        """
         try:
-            with open(cls.TOURNAMENTS_FILE, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                return [cls.from_dict(tournament) for tournament in data]
+            flush_writes()
+            return [TournamentSummary.from_dict(summary) for summary
+                    in get_repository().load_tournament_summaries()]
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Erreur lors du chargement des tournois : {e}")
             return []
 
     @classmethod
+    @instrumentation.timed
+    @profiling.traced_memory
+    def load_tournament(cls, reference):
+        """
+        Loads a single tournament with its players and rounds.
+
+        Args:
+            reference (str): The tournament reference.
+
+        Returns:
+            Tournament: The tournament, or None if it is not found.
+        """
+        flush_writes()
+        data = get_repository().load_tournament(reference)
+        return cls.from_dict(data) if data is not None else None
+
+    @classmethod
+    @instrumentation.timed
+    def load_tournament_state(cls, reference):
+        """
+        Loads the serialized state of a single tournament, without building
+        its objects.
+
+        Args:
+            reference (str): The tournament reference.
+
+        Returns:
+            dict: The serialized tournament, or None if it is not found.
+        """
+        flush_writes()
+        return get_repository().load_tournament(reference)
+
+    @classmethod
+    def iter_tournament_states(cls):
+        """
+        Yields the serialized states of the tournaments one at a time, read
+        lazily from the storage backend.
+
+        Yields:
+            dict: A serialized tournament.
+        """
+        flush_writes()
+        yield from get_repository().iter_tournaments()
+
+    @classmethod
+    def last_tournament_dates(cls):
+        """
+        Finds the end date of the last tournament of each player.
+        Unfinished tournaments, and tournaments whose end date cannot be
+        read, count as ending today at the earliest.
+
+        Returns:
+            dict: The end date (datetime) of the last tournament of each
+            player, by player id and by national ID. Players who never
+            played a tournament are not in it.
+        """
+        today = datetime.now()
+        last_dates = {}
+        for state in cls.iter_tournament_states():
+            try:
+                end_date = date_utils.parse_date(state.get("end_date", ""))
+            except ValueError:
+                end_date = today
+            if not state.get("rounds_completed", False):
+                end_date = max(end_date, today)
+            for player_data in state.get("selected_players", []):
+                for key in (player_data.get("id"), player_data.get("national_id")):
+                    if key is not None and end_date > last_dates.get(key, datetime.min):
+                        last_dates[key] = end_date
+        return last_dates
+
+    @classmethod
+    @instrumentation.timed
     def save_tournament(cls, tournaments):
         """
-        Saves the list of tournaments to the JSON file.
+        Saves the list of tournaments to the storage backend.
 
         Args:
             tournaments (list): A list of Tournament objects to be saved.
+        """
+        flush_writes()
+        get_repository().save_tournaments([tournament.to_dict() for tournament
+                                           in tournaments])
+        for tournament in tournaments:
+            tournament.mark_as_saved()
 
-        The data directory is created if it does not exist.
+    @classmethod
+    @instrumentation.timed
+    def add_tournament(cls, tournament):
         """
-        cls.check_for_data_directory()
-        with open(cls.TOURNAMENTS_FILE, 'w', encoding='utf-8') as file:
-            json.dump([tournament.to_dict() for tournament in tournaments], file,
-                      ensure_ascii=False, indent=4)
+        Adds a new tournament to the storage backend.
+
+        Args:
+            tournament (Tournament): The tournament to add.
+        """
+        flush_writes()
+        get_repository().add_tournament(tournament.to_dict())
+        tournament.mark_as_saved()
 
     @classmethod
+    @instrumentation.timed
     def save_tournament_update(cls, updated_tournament):
         """
-        Met à jour un tournoi existant dans le fichier JSON
+        Met à jour un tournoi existant dans le stockage
         en fonction de la référence du tournoi.
 
         Args:
@@ -181,23 +384,64 @@ class Tournament:
         Raises:
             ValueError: Si le tournoi avec la référence donnée n'est pas trouvé.
         """
-        tournaments = cls.load_tournaments()
-        for i, tournament in enumerate(tournaments):
-            if tournament.reference == updated_tournament.reference:
-                tournaments[i] = updated_tournament
-                cls.save_tournament(tournaments)
-                return
-        raise ValueError(f"Le tournoi avec la référence "
-                         f"{updated_tournament.reference} n'a pas été trouvé.")
+        flush_writes()
+        if not get_repository().update_tournament(updated_tournament.to_dict()):
+            raise ValueError(f"Le tournoi avec la référence "
+                             f"{updated_tournament.reference} n'a pas été trouvé.")
+        updated_tournament.mark_as_saved()
+
+    @classmethod
+    @instrumentation.timed
+    def save_tournament_progress(cls, tournament):
+        """
+        Saves the current state of a tournament being played. Only the
+        changes since the previous save are written, and nothing is written
+        if the tournament did not change.
+
+        The state is written by a background thread: call flush_saves to
+        wait for it to be on disk.
+
+        Args:
+            tournament (Tournament): The tournament to save.
+        """
+        if not tournament.is_dirty():
+            return
+        get_writer().submit(tournament.to_dict())
+        tournament.mark_as_saved()
+
+    @classmethod
+    @instrumentation.timed
+    def flush_saves(cls):
+        """Waits until the saved progress of the tournaments is written."""
+        flush_writes()
 
     def assign_players(self, selected_players):
         """
-        Adds the selected players to the tournament's list of participants.
+        Adds the selected players to the tournament's list of participants
+        and to its identity map.
 
         Args:
             selected_players (list): A list of Player objects to be added.
         """
         self.selected_players.extend(selected_players)
+        self.players_by_id.update((player.id, player) for player in selected_players)
+
+    def rebuild_opponents_history(self):
+        """
+        Rebuilds the opponents history of the players from the matches
+        of the closed rounds.
+        """
+        for player in self.selected_players:
+            player.opponents.clear()
+        for round_instance in self.rounds:
+            if not round_instance.end_time:
+                continue
+            for match in round_instance.matches:
+                player1 = self.get_player(match.player1.id)
+                player2 = self.get_player(match.player2.id)
+                if player1 and player2:
+                    player1.add_opponent(player2)
+                    player2.add_opponent(player1)
 
     def update_description(self, feedback):
         """
@@ -238,17 +482,73 @@ class Tournament:
         self.rounds.append(round_instance)
         return round_instance
 
-    def find_player_by_name(self, first_name, last_name):
+    def get_player(self, player_id):
         """
-        Finds a player in the tournament by their first and last name.
+        Finds a player of the tournament through the identity map.
 
         Args:
-            first_name (str): The player's first name.
-            last_name (str): The player's last name.
+            player_id (str): The player's id.
 
         Returns:
             Player: The found player object, or None if no match is found.
         """
-        return next((player for player in self.selected_players
-                     if player.first_name == first_name
-                     and player.last_name == last_name), None)
+        return self.players_by_id.get(player_id)
+
+
+class TournamentSummary:
+    """
+    Lightweight view of a tournament, read from the tournaments index.
+
+    Attributes:
+        reference (str): The tournament reference.
+        name (str): The name of the tournament.
+        location (str): The location of the tournament.
+        start_date (str): The start date of the tournament.
+        end_date (str): The end date of the tournament.
+        number_of_rounds (int): The total number of rounds.
+        number_of_players (int): The number of players.
+        rounds_completed (bool): Whether all the rounds have been played.
+        in_progress (bool): Whether the tournament is in progress.
+        round_count (int): The number of rounds started so far.
+    """
+    __slots__ = ("reference", "name", "location", "start_date", "end_date",
+                 "number_of_rounds", "number_of_players", "rounds_completed",
+                 "in_progress", "round_count")
+
+    def __init__(self, reference, name, location, start_date, end_date,
+                 number_of_rounds, number_of_players, rounds_completed=False,
+                 in_progress=False, round_count=0):
+        self.reference = reference
+        self.name = name
+        self.location = location
+        self.start_date = start_date
+        self.end_date = end_date
+        self.number_of_rounds = number_of_rounds
+        self.number_of_players = number_of_players
+        self.rounds_completed = rounds_completed
+        self.in_progress = in_progress
+        self.round_count = round_count
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Creates a TournamentSummary object from an index entry.
+
+        Args:
+            data (dict): A dictionary containing the summary data.
+
+        Returns:
+            TournamentSummary: The summary instance.
+        """
+        return cls(
+            data["reference"],
+            data.get("name", "Unknown"),
+            data.get("location", "Unknown"),
+            data.get("start_date", "Unknown"),
+            data.get("end_date", "Unknown"),
+            data.get("number_of_rounds", 0),
+            data.get("number_of_players", 0),
+            data.get("rounds_completed", False),
+            data.get("in_progress", False),
+            data.get("round_count", 0)
+        )
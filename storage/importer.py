@@ -0,0 +1,45 @@
+import argparse
+
+from storage.json_repository import JsonRepository
+from storage.sqlite_repository import SqliteRepository
+
+
+def import_json_archive(source, target):
+    """
+    Copies every player and tournament from the JSON files into a SQLite
+    database. Tournament progress journals are replayed first, so the
+    imported tournaments are up to date.
+
+    Args:
+        source (JsonRepository): The repository to import from.
+        target (SqliteRepository): The repository to import into.
+
+    Returns:
+        tuple: The number of imported players and tournaments.
+    """
+    players = source.load_players()
+    tournaments = source.load_tournaments()
+    target.save_players(players)
+    target.save_tournaments(tournaments)
+    return len(players), len(tournaments)
+
+
+def main():
+    """Command-line entry point: python -m storage.importer [--database FILE]."""
+    parser = argparse.ArgumentParser(
+        description="Importe les fichiers data/*.json dans une base SQLite.")
+    parser.add_argument("--database", default=SqliteRepository.DATABASE_FILE,
+                        help="Chemin de la base SQLite à alimenter.")
+    args = parser.parse_args()
+    target = SqliteRepository(args.database)
+    try:
+        players_count, tournaments_count = import_json_archive(JsonRepository(),
+                                                               target)
+    finally:
+        target.close()
+    print(f"✅ {players_count} joueurs et {tournaments_count} tournois importés "
+          f"dans {args.database}.")
+
+
+if __name__ == "__main__":
+    main()
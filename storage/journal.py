@@ -0,0 +1,393 @@
+import json
+import os
+import threading
+
+from utils import instrumentation
+
+
+class TournamentJournal:
+    """
+    Append-only journal of the state changes of tournaments being played.
+
+    Instead of rewriting the tournament file after every match, each
+    save appends the changes since the previous save (match started, score
+    set, match finished, round closed...) to a per-tournament journal file.
+    Every record is flushed and fsync'd before returning, so a crash never
+    loses a recorded result.
+
+    Journals are replayed on top of the tournament file when tournaments are
+    loaded, and compacted back into it when the tournament is finalized,
+    or in a background thread once a journal grows past COMPACTION_THRESHOLD
+    records.
+
+    All records hold absolute values (scores, flags, totals), so replaying a
+    journal on top of a state that already contains it is harmless.
+    """
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    JOURNAL_DIR = os.path.join(BASE_DIR, "data", "journals")
+    COMPACTION_THRESHOLD = 500
+
+    # Tournament fields tracked by "tournament_updated" records
+    TOURNAMENT_FIELDS = ("name", "location", "start_date", "end_date",
+                         "number_of_rounds", "number_of_players", "description",
+                         "rounds_completed", "in_progress")
+
+    def __init__(self, write_state, journal_dir=None):
+        """
+        Args:
+            write_state (callable): Writes a whole serialized tournament to
+            its tournament file; used to compact the journals.
+            journal_dir (str, optional): The directory of the journals.
+            Defaults to JOURNAL_DIR.
+        """
+        self.write_state = write_state
+        self.journal_dir = journal_dir or self.JOURNAL_DIR
+        # Last journaled state and record count, by tournament reference
+        self._states = {}
+        self._record_counts = {}
+        self._compaction_threads = {}
+        # Error met by the background compaction, by tournament reference
+        self._compaction_errors = {}
+        self._lock = threading.Lock()
+
+    def journal_path(self, reference):
+        """Returns the path of the active journal of a tournament."""
+        return os.path.join(self.journal_dir, f"{reference}.jsonl")
+
+    def compacting_path(self, reference):
+        """Returns the path of a journal being compacted in the background."""
+        return os.path.join(self.journal_dir, f"{reference}.jsonl.compacting")
+
+    def record(self, state):
+        """
+        Appends the changes made to the tournament since the last call.
+
+        The first call for a tournament writes a full snapshot, later calls
+        only write the differences. When the first snapshot of a session
+        is appended to a journal left by a previous session, the journal is
+        compacted right away, so that playing a tournament over many short
+        sessions does not pile up snapshots.
+
+        Args:
+            state (dict): The serialized tournament whose progress is saved.
+
+        Raises:
+            OSError: If a background compaction of the journal failed; the
+            journal is then compacted again.
+        """
+        reference = state["reference"]
+        previous = self._states.get(reference)
+        records = self.diff_states(previous, state)
+        if not records:
+            return
+        leftover = previous is None and self.has_journal(reference)
+        self.append(reference, records)
+        self._states[reference] = state
+        if leftover:
+            self.compact(state)
+            self._states[reference] = state
+            return
+        count = self._record_counts.get(reference, 0) + len(records)
+        self._record_counts[reference] = count
+        if (count >= self.COMPACTION_THRESHOLD
+                or reference in self._compaction_errors):
+            self.compact_in_background(reference)
+
+    def has_journal(self, reference):
+        """Checks if a tournament has journal records, rotated or not."""
+        return any(os.path.exists(path) and os.path.getsize(path) > 0
+                   for path in (self.compacting_path(reference),
+                                self.journal_path(reference)))
+
+    def append(self, reference, records):
+        """
+        Appends records to the journal of a tournament, one JSON object per line.
+
+        Args:
+            reference (str): The tournament reference.
+            records (list): The records to append.
+        """
+        os.makedirs(self.journal_dir, exist_ok=True)
+        with self._lock:
+            with open(self.journal_path(reference), 'a', encoding='utf-8') as file:
+                for record in records:
+                    line = json.dumps(record, ensure_ascii=False) + "\n"
+                    file.write(line)
+                    file.flush()
+                    os.fsync(file.fileno())
+                    if instrumentation.ENABLED:
+                        instrumentation.record_io(
+                            bytes_written=len(line.encode('utf-8')))
+
+    def compact(self, state):
+        """
+        Writes the tournament into its file and discards its journal.
+
+        Args:
+            state (dict): The serialized tournament to compact.
+        """
+        self.wait_for_compaction(state["reference"])
+        with self._lock:
+            self.write_state(state)
+        self.discard(state["reference"])
+
+    def discard(self, reference):
+        """
+        Deletes the journal of a tournament whose state has been saved
+        into its tournament file.
+
+        Args:
+            reference (str): The tournament reference.
+        """
+        self.wait_for_compaction(reference)
+        with self._lock:
+            for path in (self.compacting_path(reference),
+                         self.journal_path(reference)):
+                if os.path.exists(path):
+                    os.remove(path)
+        self._states.pop(reference, None)
+        self._record_counts.pop(reference, None)
+        self._compaction_errors.pop(reference, None)
+
+    def wait_for_compaction(self, reference):
+        """Waits for the background compaction of a tournament, if any."""
+        thread = self._compaction_threads.pop(reference, None)
+        if thread is not None:
+            thread.join()
+
+    def compact_in_background(self, reference):
+        """
+        Rotates the active journal and compacts it in a background thread.
+
+        New records go to a fresh journal while the rotated one is folded
+        into the tournament file. The thread is not a daemon, so the interpreter
+        waits for the file to be fully written before exiting.
+
+        A rotated journal left by a failed or interrupted compaction is
+        folded into the tournament file right away instead, as the last
+        journaled state contains its records.
+
+        Args:
+            reference (str): The tournament reference.
+
+        Raises:
+            OSError: If the previous background compaction failed.
+        """
+        thread = self._compaction_threads.get(reference)
+        if thread is not None and thread.is_alive():
+            return
+        self.wait_for_compaction(reference)
+        state = self._states[reference]
+        with self._lock:
+            leftover = os.path.exists(self.compacting_path(reference))
+            if leftover:
+                self.write_state(state)
+                for path in (self.compacting_path(reference),
+                             self.journal_path(reference)):
+                    if os.path.exists(path):
+                        os.remove(path)
+            else:
+                os.replace(self.journal_path(reference),
+                           self.compacting_path(reference))
+        self._record_counts[reference] = 0
+        error = self._compaction_errors.pop(reference, None)
+        if not leftover:
+            thread = threading.Thread(target=self._compact_rotated,
+                                      args=(reference, state))
+            self._compaction_threads[reference] = thread
+            thread.start()
+        if error is not None:
+            raise error
+
+    def _compact_rotated(self, reference, state):
+        """
+        Folds a rotated journal into the tournament file (background thread).
+        An error is kept to be raised by the next compaction.
+        """
+        try:
+            with self._lock:
+                self.write_state(state)
+                os.remove(self.compacting_path(reference))
+        except Exception as e:
+            self._compaction_errors[reference] = e
+
+    def read_records(self, reference):
+        """
+        Reads the journal records of a tournament, rotated journal first.
+
+        A truncated last line (interrupted write) is ignored.
+
+        Args:
+            reference (str): The tournament reference.
+
+        Returns:
+            list: The records, in the order they were written.
+        """
+        records = []
+        for path in (self.compacting_path(reference), self.journal_path(reference)):
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as file:
+                instrumentation.record_io(bytes_read=os.fstat(file.fileno()).st_size)
+                for line in file:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break
+        return records
+
+    def replay(self, data):
+        """
+        Applies the journal of a tournament to its serialized state.
+
+        Args:
+            data (dict): The tournament as stored in its file.
+
+        Returns:
+            dict: The up-to-date serialized tournament.
+        """
+        with self._lock:
+            records = self.read_records(data.get("reference"))
+        for record in records:
+            data = self.apply_record(data, record)
+        return data
+
+    def load(self, reference, read_state):
+        """
+        Reads a tournament file and applies its journal.
+
+        The file and the journal are read together, without any compaction
+        in between: otherwise, a compaction finishing after the file is read
+        would delete the rotated records before they are replayed.
+
+        Args:
+            reference (str): The tournament reference.
+            read_state (callable): Reads the tournament file.
+
+        Returns:
+            dict: The up-to-date serialized tournament.
+        """
+        with self._lock:
+            data = read_state()
+            records = self.read_records(reference)
+        for record in records:
+            data = self.apply_record(data, record)
+        return data
+
+    @staticmethod
+    def diff_states(previous, current):
+        """
+        Computes the journal records turning one serialized tournament into another.
+
+        Args:
+            previous (dict): The last journaled state, or None.
+            current (dict): The current state.
+
+        Returns:
+            list: The records describing the changes.
+        """
+        if previous is None:
+            return [{"type": "snapshot", "tournament": current}]
+        records = []
+        fields = {key: current[key] for key in TournamentJournal.TOURNAMENT_FIELDS
+                  if previous.get(key) != current.get(key)}
+        if fields:
+            records.append({"type": "tournament_updated", "fields": fields})
+        # Pairing reorders the players in place and closing a round updates
+        # their opponents history, in which cases the whole list is
+        # journaled; otherwise only the totals are.
+        if ([TournamentJournal.player_without_points(player)
+             for player in previous["selected_players"]]
+                != [TournamentJournal.player_without_points(player)
+                    for player in current["selected_players"]]):
+            records.append({"type": "players_updated",
+                            "players": current["selected_players"]})
+        else:
+            totals = [player["total_points"]
+                      for player in current["selected_players"]]
+            if totals != [player["total_points"]
+                          for player in previous["selected_players"]]:
+                records.append({"type": "points_updated", "totals": totals})
+        for index, round_data in enumerate(current["rounds"]):
+            if (index < len(previous["rounds"])
+                    and previous["rounds"][index] is round_data):
+                # Unchanged round: the model reused its serialized dict
+                continue
+            if (index >= len(previous["rounds"])
+                    or len(previous["rounds"][index]["matches"])
+                    != len(round_data["matches"])
+                    or previous["rounds"][index]["start_time"]
+                    != round_data["start_time"]):
+                records.append({"type": "round_started", "round": index,
+                                "data": round_data})
+                continue
+            previous_round = previous["rounds"][index]
+            for board, match in enumerate(round_data["matches"]):
+                records.extend(TournamentJournal.diff_match(
+                    index, board, previous_round["matches"][board], match))
+            if previous_round["end_time"] != round_data["end_time"]:
+                records.append({"type": "round_closed", "round": index,
+                                "end_time": round_data["end_time"]})
+        return records
+
+    @staticmethod
+    def player_without_points(player):
+        """Returns a serialized player without its total points."""
+        return {key: value for key, value in player.items()
+                if key != "total_points"}
+
+    @staticmethod
+    def diff_match(round_index, board, previous, current):
+        """Computes the records describing the changes of a single match."""
+        records = []
+        position = {"round": round_index, "board": board}
+        if current["in_progress"] and not previous["in_progress"]:
+            records.append({"type": "match_started", **position})
+        scores = [entry["score"] for entry in current["match"]]
+        if scores != [entry["score"] for entry in previous["match"]]:
+            records.append({"type": "score_set", "scores": scores, **position})
+        if current["finished"] and not previous["finished"]:
+            records.append({"type": "match_finished", **position})
+        return records
+
+    @staticmethod
+    def apply_record(data, record):
+        """
+        Applies a single journal record to a serialized tournament.
+
+        Args:
+            data (dict): The serialized tournament.
+            record (dict): The record to apply.
+
+        Returns:
+            dict: The updated serialized tournament.
+        """
+        record_type = record["type"]
+        if record_type == "snapshot":
+            return record["tournament"]
+        if record_type == "tournament_updated":
+            data.update(record["fields"])
+        elif record_type == "players_updated":
+            data["selected_players"] = record["players"]
+        elif record_type == "points_updated":
+            for player, total in zip(data["selected_players"], record["totals"]):
+                player["total_points"] = total
+        elif record_type == "round_started":
+            rounds = data.setdefault("rounds", [])
+            if record["round"] < len(rounds):
+                rounds[record["round"]] = record["data"]
+            else:
+                rounds.append(record["data"])
+        elif record_type == "round_closed":
+            data["rounds"][record["round"]]["end_time"] = record["end_time"]
+        else:
+            match = data["rounds"][record["round"]]["matches"][record["board"]]
+            if record_type == "match_started":
+                match["in_progress"] = True
+            elif record_type == "score_set":
+                for entry, score in zip(match["match"], record["scores"]):
+                    entry["score"] = score
+            elif record_type == "match_finished":
+                match["finished"] = True
+                match["in_progress"] = False
+        return data
@@ -0,0 +1,381 @@
+import json
+import os
+import tempfile
+
+from storage.journal import TournamentJournal
+from utils import instrumentation
+
+
+class JsonRepository:
+    """
+    Storage backend keeping players and tournaments in JSON files
+    under the data directory.
+
+    Players live in players.json. Each tournament lives in its own file,
+    tournaments/<reference>.json, and tournaments/index.json holds a short
+    summary of every tournament (name, dates, status flags, round count),
+    so tournaments can be listed and filtered without reading their rounds.
+    The progress of the tournaments being played is appended to their
+    journal (see TournamentJournal) instead of rewriting their file.
+
+    A legacy tournaments.json file is split into per-tournament files
+    the first time tournaments are accessed.
+
+    The repository exchanges serialized (dict) players and tournaments
+    with the models.
+    """
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    DATA_DIR = os.path.join(BASE_DIR, "data")
+
+    # Tournament fields copied into the summary index
+    SUMMARY_FIELDS = ("reference", "name", "location", "start_date", "end_date",
+                      "number_of_rounds", "number_of_players",
+                      "rounds_completed", "in_progress")
+
+    def __init__(self, data_dir=None):
+        """
+        Args:
+            data_dir (str, optional): The data directory. Defaults to DATA_DIR.
+        """
+        self.data_dir = data_dir or self.DATA_DIR
+        self.players_file = os.path.join(self.data_dir, "players.json")
+        self.player_index_file = os.path.join(self.data_dir, "players_index.json")
+        self.tournaments_dir = os.path.join(self.data_dir, "tournaments")
+        self.index_file = os.path.join(self.tournaments_dir, "index.json")
+        self.legacy_tournaments_file = os.path.join(self.data_dir, "tournaments.json")
+        self.journal = TournamentJournal(self.write_tournament_file,
+                                         os.path.join(self.data_dir, "journals"))
+        # Last summary written to the index, by tournament reference
+        self._summaries = {}
+
+    @staticmethod
+    def write_json_file(path, data):
+        """
+        Writes data to a JSON file atomically: the data is written to a
+        temporary file which then replaces the target, so a crash never
+        leaves a truncated file.
+
+        Args:
+            path (str): The path of the file.
+            data: The JSON-serializable data.
+        """
+        directory = os.path.dirname(path)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False, indent=4)
+                file.flush()
+                os.fsync(file.fileno())
+                instrumentation.record_io(
+                    bytes_written=os.fstat(file.fileno()).st_size)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    @staticmethod
+    def read_json_file(path):
+        """
+        Reads a JSON file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            The decoded data.
+        """
+        with open(path, 'r', encoding='utf-8') as file:
+            instrumentation.record_io(bytes_read=os.fstat(file.fileno()).st_size)
+            return json.load(file)
+
+    def check_for_data_directory(self):
+        """
+        Ensures the data directory exists.
+        If the directory doesn't exist, it is created.
+        """
+        if not os.path.exists(self.data_dir):
+            os.makedirs(self.data_dir)
+
+    def players_store_exists(self):
+        """Checks if the players file exists."""
+        return os.path.exists(self.players_file)
+
+    def players_store_signature(self):
+        """
+        Identifies the current version of the players file, to detect that
+        another process replaced it.
+
+        Returns:
+            tuple: The modification time, size and inode of the file, or
+            None if it does not exist.
+        """
+        try:
+            stat = os.stat(self.players_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def load_players(self):
+        """
+        Loads the serialized players from the JSON file.
+
+        Returns:
+            list: A list of player dictionaries, or an empty list if no file is found.
+
+        If the file does not exist, it is created and an empty list is returned.
+        """
+        self.check_for_data_directory()
+        if not os.path.exists(self.players_file):
+            with open(self.players_file, 'w', encoding='utf-8') as file:
+                json.dump([], file)
+            return []
+        return self.read_json_file(self.players_file)
+
+    def save_players(self, players_data):
+        """
+        Saves the serialized players to the JSON file.
+
+        Args:
+            players_data (list): A list of player dictionaries.
+        """
+        self.check_for_data_directory()
+        self.write_json_file(self.players_file, players_data)
+
+    def load_player_index(self):
+        """
+        Loads the secondary indexes of the players (see PlayerIndex).
+
+        Returns:
+            dict: The serialized indexes, with the signature of the players
+            file they were built from, or None if there is no readable file.
+        """
+        try:
+            return self.read_json_file(self.player_index_file)
+        except (OSError, ValueError):
+            return None
+
+    def save_player_index(self, index_data):
+        """
+        Saves the secondary indexes of the players next to players.json.
+
+        Args:
+            index_data (dict): The serialized indexes.
+        """
+        self.check_for_data_directory()
+        self.write_json_file(self.player_index_file, index_data)
+
+    def check_for_tournaments_directory(self):
+        """
+        Ensures the tournaments directory and its index exist, migrating
+        the legacy tournaments.json file if there is one.
+        """
+        if os.path.exists(self.index_file):
+            return
+        os.makedirs(self.tournaments_dir, exist_ok=True)
+        if os.path.exists(self.legacy_tournaments_file):
+            legacy = self.read_json_file(self.legacy_tournaments_file)
+            self.save_tournaments([self.journal.replay(tournament)
+                                   for tournament in legacy])
+            os.replace(self.legacy_tournaments_file,
+                       self.legacy_tournaments_file + ".migrated")
+        else:
+            self.save_index([])
+
+    def tournament_path(self, reference):
+        """Returns the path of the file of a tournament."""
+        return os.path.join(self.tournaments_dir, f"{reference}.json")
+
+    def load_index(self):
+        """
+        Loads the tournaments summary index.
+
+        Returns:
+            list: A list of tournament summary dictionaries.
+        """
+        self.check_for_tournaments_directory()
+        return self.read_json_file(self.index_file)
+
+    def save_index(self, summaries):
+        """
+        Saves the tournaments summary index.
+
+        Args:
+            summaries (list): A list of tournament summary dictionaries.
+        """
+        self.write_json_file(self.index_file, summaries)
+        self._summaries = {summary["reference"]: summary for summary in summaries}
+
+    @classmethod
+    def summarize(cls, state):
+        """
+        Builds the index summary of a serialized tournament.
+
+        Args:
+            state (dict): The serialized tournament.
+
+        Returns:
+            dict: The summary of the tournament.
+        """
+        summary = {field: state.get(field) for field in cls.SUMMARY_FIELDS}
+        summary["round_count"] = len(state.get("rounds", []))
+        return summary
+
+    def update_summary(self, state):
+        """
+        Updates the summary of a tournament in the index, if it changed.
+
+        Args:
+            state (dict): The serialized tournament.
+        """
+        summary = self.summarize(state)
+        if self._summaries.get(summary["reference"]) == summary:
+            return
+        summaries = self.load_index()
+        for i, entry in enumerate(summaries):
+            if entry["reference"] == summary["reference"]:
+                summaries[i] = summary
+                break
+        else:
+            summaries.append(summary)
+        self.save_index(summaries)
+
+    def load_tournament_summaries(self):
+        """
+        Loads the summaries of all tournaments from the index.
+
+        The tournaments with a progress journal are re-summarized from their
+        replayed state, in case the application stopped before their index
+        entry was updated.
+
+        Returns:
+            list: A list of tournament summary dictionaries.
+        """
+        summaries = self.load_index()
+        for i, summary in enumerate(summaries):
+            reference = summary["reference"]
+            if (os.path.exists(self.journal.journal_path(reference))
+                    or os.path.exists(self.journal.compacting_path(reference))):
+                state = self.load_tournament(reference)
+                if state is not None:
+                    summaries[i] = self.summarize(state)
+        return summaries
+
+    def load_tournament(self, reference):
+        """
+        Loads a single serialized tournament, replaying its progress journal.
+
+        Args:
+            reference (str): The tournament reference.
+
+        Returns:
+            dict: The serialized tournament, or None if it doesn't exist.
+        """
+        self.check_for_tournaments_directory()
+        path = self.tournament_path(reference)
+        if not os.path.exists(path):
+            return None
+        return self.journal.load(reference, lambda: self.read_json_file(path))
+
+    def load_tournaments(self):
+        """
+        Loads all the serialized tournaments, in creation order.
+
+        Returns:
+            list: A list of tournament dictionaries.
+        """
+        tournaments = (self.load_tournament(summary["reference"])
+                       for summary in self.load_index())
+        return [tournament for tournament in tournaments if tournament is not None]
+
+    def iter_tournaments(self):
+        """
+        Yields the serialized tournaments one at a time, in creation order,
+        so that only one of them is in memory at once.
+
+        Yields:
+            dict: A tournament dictionary.
+        """
+        for summary in self.load_index():
+            tournament = self.load_tournament(summary["reference"])
+            if tournament is not None:
+                yield tournament
+
+    def write_tournament_file(self, state):
+        """
+        Writes a serialized tournament to its own file, atomically.
+
+        Args:
+            state (dict): The serialized tournament.
+        """
+        os.makedirs(self.tournaments_dir, exist_ok=True)
+        self.write_json_file(self.tournament_path(state["reference"]), state)
+
+    def save_tournaments(self, tournaments_data):
+        """
+        Saves the serialized tournaments, replacing all the stored ones.
+
+        The journals of the saved tournaments are discarded, as the
+        saved states supersede them.
+
+        Args:
+            tournaments_data (list): A list of tournament dictionaries.
+        """
+        os.makedirs(self.tournaments_dir, exist_ok=True)
+        kept = {state["reference"] for state in tournaments_data}
+        for file_name in os.listdir(self.tournaments_dir):
+            reference, extension = os.path.splitext(file_name)
+            if (extension == ".json" and file_name != "index.json"
+                    and reference not in kept):
+                os.remove(os.path.join(self.tournaments_dir, file_name))
+        for state in tournaments_data:
+            self.write_tournament_file(state)
+            self.journal.discard(state["reference"])
+        self.save_index([self.summarize(state) for state in tournaments_data])
+
+    def add_tournament(self, state):
+        """
+        Adds a new tournament.
+
+        Args:
+            state (dict): The serialized tournament.
+        """
+        self.check_for_tournaments_directory()
+        self.write_tournament_file(state)
+        self.update_summary(state)
+
+    def update_tournament(self, state):
+        """
+        Replaces a stored tournament with its current state.
+
+        Args:
+            state (dict): The serialized tournament.
+
+        Returns:
+            bool: False if no tournament has the given reference.
+        """
+        self.check_for_tournaments_directory()
+        if not os.path.exists(self.tournament_path(state["reference"])):
+            return False
+        self.journal.compact(state)
+        self.update_summary(state)
+        return True
+
+    @instrumentation.timed
+    def save_tournament_progress(self, state):
+        """
+        Saves the current state of a tournament.
+
+        While the tournament is being played, the changes are appended to its
+        progress journal. Once it is finalized, the journal is compacted
+        into the tournament file.
+
+        Args:
+            state (dict): The serialized tournament.
+        """
+        self.check_for_tournaments_directory()
+        if state["in_progress"]:
+            self.journal.record(state)
+        else:
+            self.journal.compact(state)
+        self.update_summary(state)
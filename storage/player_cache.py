@@ -0,0 +1,139 @@
+from storage.player_index import PlayerIndex
+
+
+class PlayerCache:
+    """
+    Keeps the serialized players of a repository in memory, with an index
+    by player id, so that navigating the menus does not read and parse the
+    players file again and again.
+
+    The cache is refreshed when the store is changed by another process,
+    which the repository detects through players_store_signature() (the
+    mtime, size and inode of players.json, or the data version of the
+    SQLite database). The writes made through the cache update it directly.
+
+    The cache also maintains the secondary indexes of the players (see
+    PlayerIndex). They are stored by the repository with the signature of
+    the players store, and rebuilt when that signature does not match.
+    Saves update them incrementally.
+
+    The cached dictionaries are shared: callers must not modify them, but
+    build new objects (e.g. Player.from_dict) from them.
+    """
+    def __init__(self, repository):
+        """
+        Args:
+            repository: The storage backend holding the players.
+        """
+        self.repository = repository
+        self._players = None
+        self._players_by_id = {}
+        self._signature = None
+        self._index = None
+
+    def _refresh(self):
+        """Reloads the players if the store changed since they were cached."""
+        # Read before loading, so a change made meanwhile is seen next time
+        signature = self.repository.players_store_signature()
+        if self._players is None or signature != self._signature:
+            self._store(self.repository.load_players())
+            self._signature = signature
+            self._index = self._load_index()
+
+    def _load_index(self):
+        """
+        Loads the stored indexes if they match the cached players, or
+        rebuilds and stores them.
+
+        Returns:
+            PlayerIndex: The indexes of the cached players.
+        """
+        index_data = self.repository.load_player_index()
+        signature = self._signature_data()
+        if index_data and signature and index_data.get("signature") == signature:
+            try:
+                return PlayerIndex.from_dict(index_data)
+            except (KeyError, TypeError, ValueError):
+                pass
+        index = PlayerIndex.from_players(self._players)
+        self._save_index(index)
+        return index
+
+    def _signature_data(self):
+        """Returns the store signature in its JSON form, or None."""
+        if self._signature is None:
+            return None
+        if isinstance(self._signature, tuple):
+            return list(self._signature)
+        return self._signature
+
+    def _save_index(self, index):
+        """Stores the indexes with the signature of the players store."""
+        signature = self._signature_data()
+        if signature is not None:
+            self.repository.save_player_index({"signature": signature,
+                                               **index.to_dict()})
+
+    def _store(self, players_data):
+        """Caches a list of serialized players and indexes them by id."""
+        self._players = players_data
+        self._players_by_id = {player["id"]: player for player in players_data}
+
+    def load_players(self):
+        """
+        Returns the serialized players, read from the store only if they
+        are not cached or the store changed.
+
+        Returns:
+            list: A new list of the cached player dictionaries.
+        """
+        self._refresh()
+        return list(self._players)
+
+    def get_player(self, player_id):
+        """
+        Looks up a serialized player by id.
+
+        Args:
+            player_id (str): The player id.
+
+        Returns:
+            dict: The serialized player, or None if not found.
+        """
+        self._refresh()
+        return self._players_by_id.get(player_id)
+
+    def count_players(self):
+        """Returns the number of registered players."""
+        self._refresh()
+        return len(self._players)
+
+    def save_players(self, players_data):
+        """
+        Saves the serialized players to the store and caches them.
+
+        Args:
+            players_data (list): A list of player dictionaries.
+        """
+        self.repository.save_players(players_data)
+        previous_players = self._players_by_id if self._index is not None else None
+        self._store(list(players_data))
+        self._signature = self.repository.players_store_signature()
+        if previous_players is None:
+            self._index = PlayerIndex.from_players(self._players)
+        else:
+            self._index.update(previous_players, self._players)
+        self._save_index(self._index)
+
+    @property
+    def index(self):
+        """PlayerIndex: The secondary indexes of the registered players."""
+        self._refresh()
+        return self._index
+
+    def invalidate(self):
+        """Drops the cached players, e.g. after writing the store directly."""
+        self._players = None
+        self._players_by_id = {}
+        self._signature = None
+        self._index = None
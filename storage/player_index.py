@@ -0,0 +1,179 @@
+from bisect import bisect_left, insort
+
+
+class PlayerIndex:
+    """
+    Secondary indexes on the registered players, kept in memory by the
+    player cache and stored next to players.json.
+
+    Attributes:
+        national_ids (dict): The player id by national ID.
+        last_names (list): Sorted (last name, player id) pairs, searched
+        by prefix with bisect.
+        birth_years (dict): The set of player ids by year of birth.
+    """
+    def __init__(self):
+        self.national_ids = {}
+        self.last_names = []
+        self.birth_years = {}
+
+    @staticmethod
+    def last_name_key(last_name):
+        """Returns the form of a last name used for sorting and searching."""
+        return last_name.strip().upper()
+
+    @staticmethod
+    def birth_year(date_of_birth):
+        """Returns the year of a DD/MM/YYYY date of birth."""
+        return date_of_birth.strip()[-4:]
+
+    @classmethod
+    def from_players(cls, players_data):
+        """
+        Builds the indexes of a list of serialized players.
+
+        Args:
+            players_data (list): A list of player dictionaries.
+
+        Returns:
+            PlayerIndex: The indexes.
+        """
+        index = cls()
+        for player in players_data:
+            index.national_ids[player["national_id"].upper()] = player["id"]
+            index.last_names.append((cls.last_name_key(player["last_name"]),
+                                     player["id"]))
+            index.birth_years.setdefault(cls.birth_year(player["date_of_birth"]),
+                                         set()).add(player["id"])
+        index.last_names.sort()
+        return index
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Restores the indexes saved by to_dict().
+
+        Args:
+            data (dict): The serialized indexes.
+
+        Returns:
+            PlayerIndex: The indexes.
+        """
+        index = cls()
+        index.national_ids = dict(data["national_ids"])
+        index.last_names = [tuple(entry) for entry in data["last_names"]]
+        index.birth_years = {year: set(player_ids) for year, player_ids
+                             in data["birth_years"].items()}
+        return index
+
+    def to_dict(self):
+        """
+        Converts the indexes to a dictionary format for serialization.
+
+        Returns:
+            dict: The serialized indexes.
+        """
+        return {
+            "national_ids": self.national_ids,
+            "last_names": [list(entry) for entry in self.last_names],
+            "birth_years": {year: sorted(player_ids) for year, player_ids
+                            in self.birth_years.items()},
+        }
+
+    def add(self, player):
+        """
+        Indexes a serialized player.
+
+        Args:
+            player (dict): The player dictionary.
+        """
+        self.national_ids[player["national_id"].upper()] = player["id"]
+        insort(self.last_names, (self.last_name_key(player["last_name"]), player["id"]))
+        self.birth_years.setdefault(self.birth_year(player["date_of_birth"]),
+                                    set()).add(player["id"])
+
+    def remove(self, player):
+        """
+        Removes a serialized player from the indexes.
+
+        Args:
+            player (dict): The player dictionary, as it was indexed.
+        """
+        national_id = player["national_id"].upper()
+        if self.national_ids.get(national_id) == player["id"]:
+            del self.national_ids[national_id]
+        entry = (self.last_name_key(player["last_name"]), player["id"])
+        position = bisect_left(self.last_names, entry)
+        if position < len(self.last_names) and self.last_names[position] == entry:
+            del self.last_names[position]
+        year = self.birth_year(player["date_of_birth"])
+        player_ids = self.birth_years.get(year, set())
+        player_ids.discard(player["id"])
+        if not player_ids:
+            self.birth_years.pop(year, None)
+
+    def update(self, previous_players, players_data):
+        """
+        Updates the indexes incrementally after a save: only the added,
+        deleted and modified players are indexed again.
+
+        Args:
+            previous_players (dict): The previously saved player
+            dictionaries, by id.
+            players_data (list): The saved player dictionaries.
+        """
+        saved_ids = set()
+        for player in players_data:
+            saved_ids.add(player["id"])
+            previous = previous_players.get(player["id"])
+            if previous == player:
+                continue
+            if previous is not None:
+                self.remove(previous)
+            self.add(player)
+        for player_id, previous in previous_players.items():
+            if player_id not in saved_ids:
+                self.remove(previous)
+
+    def find_national_id(self, national_id):
+        """
+        Looks up a player by national ID.
+
+        Args:
+            national_id (str): The national ID, in any case.
+
+        Returns:
+            str: The player id, or None if not found.
+        """
+        return self.national_ids.get(national_id.strip().upper())
+
+    def search_last_name(self, prefix):
+        """
+        Finds the players whose last name starts with a prefix.
+
+        Args:
+            prefix (str): The beginning of the last name, in any case.
+
+        Returns:
+            list: The player ids, in alphabetical order of the last names.
+        """
+        prefix = self.last_name_key(prefix)
+        player_ids = []
+        position = bisect_left(self.last_names, (prefix,))
+        while (position < len(self.last_names)
+               and self.last_names[position][0].startswith(prefix)):
+            player_ids.append(self.last_names[position][1])
+            position += 1
+        return player_ids
+
+    def find_birth_year(self, year):
+        """
+        Finds the players born in a given year.
+
+        Args:
+            year (str): The year, on 4 digits.
+
+        Returns:
+            set: The player ids.
+        """
+        return set(self.birth_years.get(str(year).strip(), ()))
@@ -0,0 +1,105 @@
+import atexit
+import os
+
+# Environment variable selecting the storage backend ("json" or "sqlite")
+STORAGE_BACKEND_VARIABLE = "CHESS_STORAGE"
+
+_repository = None
+_player_cache = None
+_writer = None
+
+
+def create_repository(backend):
+    """
+    Instantiates the repository of a storage backend.
+
+    Args:
+        backend (str): The backend name, "json" or "sqlite".
+
+    Returns:
+        JsonRepository or SqliteRepository: The repository instance.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == "json":
+        from storage.json_repository import JsonRepository
+        return JsonRepository()
+    if backend == "sqlite":
+        from storage.sqlite_repository import SqliteRepository
+        return SqliteRepository()
+    raise ValueError(f"Backend de stockage inconnu : {backend}")
+
+
+def get_repository():
+    """
+    Returns the repository used by the models to persist players
+    and tournaments.
+
+    The backend is chosen through the CHESS_STORAGE environment variable
+    and defaults to the JSON files.
+
+    Returns:
+        JsonRepository or SqliteRepository: The shared repository instance.
+    """
+    global _repository
+    if _repository is None:
+        backend = os.environ.get(STORAGE_BACKEND_VARIABLE, "json").strip().lower()
+        _repository = create_repository(backend)
+    return _repository
+
+
+def set_repository(repository):
+    """
+    Replaces the shared repository.
+
+    The pending background saves are written to the previous repository
+    first.
+
+    Args:
+        repository: The repository the models should use from now on.
+    """
+    global _repository, _player_cache
+    flush_writes()
+    _repository = repository
+    _player_cache = None
+
+
+def get_player_cache():
+    """
+    Returns the cache of the registered players, shared by the whole
+    process and backed by the shared repository.
+
+    Returns:
+        PlayerCache: The shared cache instance.
+    """
+    global _player_cache
+    if _player_cache is None:
+        from storage.player_cache import PlayerCache
+        _player_cache = PlayerCache(get_repository())
+    return _player_cache
+
+
+def get_writer():
+    """
+    Returns the background writer persisting the progress of the
+    tournaments through the shared repository.
+
+    The pending saves are flushed when the interpreter exits.
+
+    Returns:
+        BackgroundWriter: The shared writer instance.
+    """
+    global _writer
+    if _writer is None:
+        from storage.writer import BackgroundWriter
+        _writer = BackgroundWriter(
+            lambda state: get_repository().save_tournament_progress(state))
+        atexit.register(_writer.flush)
+    return _writer
+
+
+def flush_writes():
+    """Waits for the pending background saves to be written, if any."""
+    if _writer is not None:
+        _writer.flush()
@@ -0,0 +1,532 @@
+import functools
+import json
+import os
+import sqlite3
+import threading
+
+from storage.journal import TournamentJournal
+from utils import instrumentation
+
+
+def synchronized(method):
+    """
+    Serializes the calls to a repository method, the connection being
+    shared by the interactive thread and the background writer.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class SqliteRepository:
+    """
+    Storage backend keeping players and tournaments in a SQLite database.
+
+    The database runs in WAL mode and stores tournaments, their players,
+    rounds and matches in separate tables, so saving the progress of a
+    tournament only touches the rows that changed: setting the score of a
+    match is a single-row UPDATE.
+
+    The repository exchanges serialized (dict) players and tournaments
+    with the models, exactly like JsonRepository.
+    """
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    DATABASE_FILE = os.path.join(BASE_DIR, "data", "chess.sqlite3")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS players (
+            id TEXT PRIMARY KEY,
+            last_name TEXT NOT NULL,
+            first_name TEXT NOT NULL,
+            date_of_birth TEXT,
+            national_id TEXT,
+            total_points NUMERIC NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_players_national_id
+            ON players (national_id);
+
+        CREATE TABLE IF NOT EXISTS tournaments (
+            reference TEXT PRIMARY KEY,
+            name TEXT,
+            location TEXT,
+            start_date TEXT,
+            end_date TEXT,
+            number_of_rounds INTEGER,
+            number_of_players INTEGER,
+            description TEXT,
+            rounds_completed INTEGER NOT NULL DEFAULT 0,
+            in_progress INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TABLE IF NOT EXISTS tournament_players (
+            tournament_reference TEXT NOT NULL
+                REFERENCES tournaments (reference) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            id TEXT,
+            last_name TEXT,
+            first_name TEXT,
+            date_of_birth TEXT,
+            national_id TEXT,
+            total_points NUMERIC NOT NULL DEFAULT 0,
+            opponents TEXT,
+            PRIMARY KEY (tournament_reference, position)
+        );
+        CREATE INDEX IF NOT EXISTS idx_tournament_players_id
+            ON tournament_players (id);
+        CREATE INDEX IF NOT EXISTS idx_tournament_players_national_id
+            ON tournament_players (national_id);
+
+        CREATE TABLE IF NOT EXISTS rounds (
+            tournament_reference TEXT NOT NULL
+                REFERENCES tournaments (reference) ON DELETE CASCADE,
+            round_index INTEGER NOT NULL,
+            round_number INTEGER NOT NULL,
+            start_time TEXT,
+            end_time TEXT,
+            PRIMARY KEY (tournament_reference, round_index)
+        );
+
+        CREATE TABLE IF NOT EXISTS matches (
+            tournament_reference TEXT NOT NULL,
+            round_index INTEGER NOT NULL,
+            board INTEGER NOT NULL,
+            player1_id TEXT,
+            player1_last_name TEXT,
+            player1_first_name TEXT,
+            score1 NUMERIC NOT NULL DEFAULT 0,
+            player2_id TEXT,
+            player2_last_name TEXT,
+            player2_first_name TEXT,
+            score2 NUMERIC NOT NULL DEFAULT 0,
+            finished INTEGER NOT NULL DEFAULT 0,
+            in_progress INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (tournament_reference, round_index, board),
+            FOREIGN KEY (tournament_reference, round_index)
+                REFERENCES rounds (tournament_reference, round_index)
+                ON DELETE CASCADE
+        );
+        CREATE INDEX IF NOT EXISTS idx_matches_player1 ON matches (player1_id);
+        CREATE INDEX IF NOT EXISTS idx_matches_player2 ON matches (player2_id);
+    """
+
+    PLAYER_COLUMNS = ("id", "last_name", "first_name", "date_of_birth",
+                      "national_id", "total_points")
+
+    def __init__(self, database_file=None):
+        """
+        Opens (and creates if needed) the database.
+
+        Args:
+            database_file (str, optional): Path of the database file.
+            Defaults to DATABASE_FILE.
+        """
+        self.database_file = database_file or self.DATABASE_FILE
+        os.makedirs(os.path.dirname(os.path.abspath(self.database_file)),
+                    exist_ok=True)
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(self.database_file,
+                                          check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(self.SCHEMA)
+        self.upgrade_schema()
+        # Last saved state of the tournaments being played, by reference
+        self._states = {}
+
+    def upgrade_schema(self):
+        """Adds the columns missing from databases created by older versions."""
+        columns = {row["name"] for row in self.connection.execute(
+            "PRAGMA table_info(tournament_players)")}
+        if "opponents" not in columns:
+            self.connection.execute(
+                "ALTER TABLE tournament_players ADD COLUMN opponents TEXT")
+            self.connection.commit()
+
+    @synchronized
+    def close(self):
+        """Closes the database connection."""
+        self.connection.close()
+
+    @synchronized
+    def players_store_exists(self):
+        """Checks if at least one player is registered."""
+        return self.connection.execute(
+            "SELECT 1 FROM players LIMIT 1").fetchone() is not None
+
+    @synchronized
+    def players_store_signature(self):
+        """
+        Identifies the current version of the database, to detect that
+        another connection changed it.
+
+        Returns:
+            int: The data version of the database, which changes on every
+            commit of another connection.
+        """
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    @synchronized
+    def load_players(self):
+        """
+        Loads the serialized players.
+
+        Returns:
+            list: A list of player dictionaries, in registration order.
+        """
+        rows = self.connection.execute(
+            "SELECT id, last_name, first_name, date_of_birth, national_id, "
+            "total_points FROM players ORDER BY rowid")
+        return [dict(row) for row in rows]
+
+    def load_player_index(self):
+        """
+        The database indexes the players itself: the secondary indexes of
+        the player cache are rebuilt in memory and not stored.
+
+        Returns:
+            None
+        """
+        return None
+
+    def save_player_index(self, index_data):
+        """Does nothing, see load_player_index()."""
+
+    @synchronized
+    def save_players(self, players_data):
+        """
+        Saves the serialized players: new players are inserted, changed ones
+        updated and the ones missing from the list deleted.
+
+        Args:
+            players_data (list): A list of player dictionaries.
+        """
+        with self.connection:
+            self.connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS kept_players (id TEXT PRIMARY KEY)")
+            self.connection.execute("DELETE FROM kept_players")
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO kept_players (id) VALUES (?)",
+                [(player["id"],) for player in players_data])
+            self.connection.execute(
+                "DELETE FROM players WHERE id NOT IN (SELECT id FROM kept_players)")
+            self.connection.executemany(
+                "INSERT INTO players (id, last_name, first_name, date_of_birth, "
+                "national_id, total_points) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET last_name = excluded.last_name, "
+                "first_name = excluded.first_name, "
+                "date_of_birth = excluded.date_of_birth, "
+                "national_id = excluded.national_id, "
+                "total_points = excluded.total_points",
+                [tuple(player.get(column) for column in self.PLAYER_COLUMNS)
+                 for player in players_data])
+
+    @synchronized
+    def load_tournament_summaries(self):
+        """
+        Loads the summaries of all tournaments (name, dates, status flags
+        and round count), without reading their players, rounds and matches.
+
+        Returns:
+            list: A list of tournament summary dictionaries.
+        """
+        rows = self.connection.execute(
+            "SELECT reference, name, location, start_date, end_date, "
+            "number_of_rounds, number_of_players, rounds_completed, in_progress, "
+            "(SELECT COUNT(*) FROM rounds "
+            "WHERE rounds.tournament_reference = tournaments.reference) "
+            "AS round_count FROM tournaments ORDER BY rowid")
+        summaries = []
+        for row in rows:
+            summary = dict(row)
+            summary["rounds_completed"] = bool(summary["rounds_completed"])
+            summary["in_progress"] = bool(summary["in_progress"])
+            summaries.append(summary)
+        return summaries
+
+    @synchronized
+    def load_tournament(self, reference):
+        """
+        Loads a single serialized tournament.
+
+        Args:
+            reference (str): The tournament reference.
+
+        Returns:
+            dict: The serialized tournament, or None if it doesn't exist.
+        """
+        tournaments = self.load_tournaments(reference)
+        return tournaments[0] if tournaments else None
+
+    @synchronized
+    def load_tournaments(self, reference=None):
+        """
+        Loads the serialized tournaments, with their players, rounds and matches.
+
+        Args:
+            reference (str, optional): Only loads the tournament with this
+            reference.
+
+        Returns:
+            list: A list of tournament dictionaries.
+        """
+        tournament_where, where, params = "", "", ()
+        if reference is not None:
+            tournament_where = "WHERE reference = ?"
+            where = "WHERE tournament_reference = ?"
+            params = (reference,)
+        tournaments = {}
+        for row in self.connection.execute(
+                f"SELECT * FROM tournaments {tournament_where} ORDER BY rowid",
+                params):
+            tournament = dict(row)
+            tournament["rounds_completed"] = bool(tournament["rounds_completed"])
+            tournament["in_progress"] = bool(tournament["in_progress"])
+            tournament["selected_players"] = []
+            tournament["rounds"] = []
+            tournaments[tournament["reference"]] = tournament
+        for row in self.connection.execute(
+                f"SELECT * FROM tournament_players {where} "
+                "ORDER BY tournament_reference, position", params):
+            player = {column: row[column] for column in self.PLAYER_COLUMNS}
+            if row["opponents"] is not None:
+                player["opponents"] = json.loads(row["opponents"])
+            tournaments[row["tournament_reference"]]["selected_players"].append(
+                player)
+        for row in self.connection.execute(
+                f"SELECT * FROM rounds {where} "
+                "ORDER BY tournament_reference, round_index", params):
+            tournaments[row["tournament_reference"]]["rounds"].append({
+                "round_number": row["round_number"],
+                "start_time": row["start_time"],
+                "end_time": row["end_time"],
+                "matches": []
+            })
+        for row in self.connection.execute(
+                f"SELECT * FROM matches {where} "
+                "ORDER BY tournament_reference, round_index, board", params):
+            rounds = tournaments[row["tournament_reference"]]["rounds"]
+            rounds[row["round_index"]]["matches"].append(self.match_from_row(row))
+        return list(tournaments.values())
+
+    def iter_tournaments(self):
+        """
+        Yields the serialized tournaments one at a time, in creation order,
+        so that only one of them is in memory at once.
+
+        Yields:
+            dict: A tournament dictionary.
+        """
+        with self._lock:
+            references = [row["reference"] for row in self.connection.execute(
+                "SELECT reference FROM tournaments ORDER BY rowid")]
+        for reference in references:
+            tournament = self.load_tournament(reference)
+            if tournament is not None:
+                yield tournament
+
+    @synchronized
+    def save_tournaments(self, tournaments_data):
+        """
+        Saves the serialized tournaments, replacing all the stored ones.
+
+        Args:
+            tournaments_data (list): A list of tournament dictionaries.
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM tournaments")
+            for state in tournaments_data:
+                self.write_tournament(state)
+        self._states.clear()
+
+    @synchronized
+    def add_tournament(self, state):
+        """
+        Adds a new tournament.
+
+        Args:
+            state (dict): The serialized tournament.
+        """
+        with self.connection:
+            self.write_tournament(state)
+        self._states[state["reference"]] = state
+
+    @synchronized
+    def update_tournament(self, state):
+        """
+        Replaces a stored tournament with its current state.
+
+        Args:
+            state (dict): The serialized tournament.
+
+        Returns:
+            bool: False if no tournament has the given reference.
+        """
+        exists = self.connection.execute(
+            "SELECT 1 FROM tournaments WHERE reference = ?",
+            (state["reference"],)).fetchone()
+        if not exists:
+            return False
+        with self.connection:
+            self.write_tournament(state)
+        self._states[state["reference"]] = state
+        return True
+
+    @synchronized
+    @instrumentation.timed
+    def save_tournament_progress(self, state):
+        """
+        Saves the current state of a tournament, writing only the rows
+        that changed since the previous save.
+
+        The changes are computed like the JSON progress journal records,
+        then each record is turned into the matching UPDATE statements.
+
+        Args:
+            state (dict): The serialized tournament.
+        """
+        reference = state["reference"]
+        records = TournamentJournal.diff_states(self._states.get(reference), state)
+        if not records:
+            return
+        with self.connection:
+            for record in records:
+                self.apply_record(reference, record)
+        self._states[reference] = state
+
+    def apply_record(self, reference, record):
+        """
+        Applies a progress record to the tables of a tournament.
+
+        Args:
+            reference (str): The tournament reference.
+            record (dict): A record, as computed by TournamentJournal.diff_states.
+        """
+        record_type = record["type"]
+        execute = self.connection.execute
+        if record_type == "snapshot":
+            self.write_tournament(record["tournament"])
+        elif record_type == "tournament_updated":
+            fields = record["fields"]
+            assignments = ", ".join(f"{column} = ?" for column in fields)
+            execute(f"UPDATE tournaments SET {assignments} WHERE reference = ?",
+                    (*fields.values(), reference))
+        elif record_type == "players_updated":
+            self.write_tournament_players(reference, record["players"])
+        elif record_type == "points_updated":
+            self.connection.executemany(
+                "UPDATE tournament_players SET total_points = ? "
+                "WHERE tournament_reference = ? AND position = ? "
+                "AND total_points IS NOT ?",
+                [(total, reference, position, total)
+                 for position, total in enumerate(record["totals"])])
+        elif record_type == "round_started":
+            self.write_round(reference, record["round"], record["data"])
+        elif record_type == "round_closed":
+            execute("UPDATE rounds SET end_time = ? "
+                    "WHERE tournament_reference = ? AND round_index = ?",
+                    (record["end_time"], reference, record["round"]))
+        else:
+            position = (reference, record["round"], record["board"])
+            where = "WHERE tournament_reference = ? AND round_index = ? AND board = ?"
+            if record_type == "match_started":
+                execute(f"UPDATE matches SET in_progress = 1 {where}", position)
+            elif record_type == "score_set":
+                execute(f"UPDATE matches SET score1 = ?, score2 = ? {where}",
+                        (*record["scores"], *position))
+            elif record_type == "match_finished":
+                execute(f"UPDATE matches SET finished = 1, in_progress = 0 {where}",
+                        position)
+
+    def write_tournament(self, state):
+        """
+        Writes a whole tournament: its row, players, rounds and matches.
+
+        Args:
+            state (dict): The serialized tournament.
+        """
+        reference = state["reference"]
+        self.connection.execute(
+            "INSERT INTO tournaments (reference, name, location, start_date, "
+            "end_date, number_of_rounds, number_of_players, description, "
+            "rounds_completed, in_progress) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (reference) DO UPDATE SET name = excluded.name, "
+            "location = excluded.location, start_date = excluded.start_date, "
+            "end_date = excluded.end_date, "
+            "number_of_rounds = excluded.number_of_rounds, "
+            "number_of_players = excluded.number_of_players, "
+            "description = excluded.description, "
+            "rounds_completed = excluded.rounds_completed, "
+            "in_progress = excluded.in_progress",
+            (reference, state.get("name"), state.get("location"),
+             state.get("start_date"), state.get("end_date"),
+             state.get("number_of_rounds"), state.get("number_of_players"),
+             state.get("description"), bool(state.get("rounds_completed")),
+             bool(state.get("in_progress"))))
+        self.write_tournament_players(reference, state.get("selected_players", []))
+        self.connection.execute("DELETE FROM rounds WHERE tournament_reference = ?",
+                                (reference,))
+        for index, round_data in enumerate(state.get("rounds", [])):
+            self.write_round(reference, index, round_data)
+
+    def write_tournament_players(self, reference, players_data):
+        """Replaces the players registered in a tournament."""
+        self.connection.execute(
+            "DELETE FROM tournament_players WHERE tournament_reference = ?",
+            (reference,))
+        self.connection.executemany(
+            "INSERT INTO tournament_players (tournament_reference, position, id, "
+            "last_name, first_name, date_of_birth, national_id, total_points, "
+            "opponents) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(reference, position,
+              *(player.get(column) for column in self.PLAYER_COLUMNS),
+              json.dumps(player["opponents"]) if "opponents" in player else None)
+             for position, player in enumerate(players_data)])
+
+    def write_round(self, reference, round_index, round_data):
+        """Replaces a round of a tournament and its matches."""
+        self.connection.execute(
+            "DELETE FROM rounds WHERE tournament_reference = ? AND round_index = ?",
+            (reference, round_index))
+        self.connection.execute(
+            "INSERT INTO rounds (tournament_reference, round_index, round_number, "
+            "start_time, end_time) VALUES (?, ?, ?, ?, ?)",
+            (reference, round_index, round_data["round_number"],
+             round_data.get("start_time"), round_data.get("end_time")))
+        self.connection.executemany(
+            "INSERT INTO matches (tournament_reference, round_index, board, "
+            "player1_id, player1_last_name, player1_first_name, score1, "
+            "player2_id, player2_last_name, player2_first_name, score2, "
+            "finished, in_progress) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(reference, round_index, board, *self.match_to_row(match))
+             for board, match in enumerate(round_data.get("matches", []))])
+
+    @staticmethod
+    def match_to_row(match):
+        """Flattens a serialized match into the columns of the matches table."""
+        values = []
+        for entry in match["match"]:
+            player = entry["player"]
+            values.extend((player.get("id"), player.get("last_name"),
+                           player.get("first_name"), entry["score"]))
+        values.extend((bool(match.get("finished")), bool(match.get("in_progress"))))
+        return values
+
+    @staticmethod
+    def match_from_row(row):
+        """Rebuilds a serialized match from a row of the matches table."""
+        return {
+            "match": [
+                {"player": {"id": row[f"player{side}_id"],
+                            "last_name": row[f"player{side}_last_name"],
+                            "first_name": row[f"player{side}_first_name"]},
+                 "score": row[f"score{side}"]}
+                for side in (1, 2)
+            ],
+            "finished": bool(row["finished"]),
+            "in_progress": bool(row["in_progress"])
+        }
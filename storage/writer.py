@@ -0,0 +1,77 @@
+import threading
+
+
+class BackgroundWriter:
+    """
+    Persistence worker saving tournament states in a background thread.
+
+    The interactive loop hands serialized tournaments to submit(), which
+    returns immediately. Bursts of saves are coalesced: only the latest
+    pending state of each tournament reference is written. flush() is the
+    barrier waiting for every pending state to be written; it is called
+    when a round is closed and before the application exits, so no round
+    result is lost.
+
+    An error raised while writing is re-raised by the next call to
+    submit() or flush().
+    """
+    def __init__(self, write_state):
+        """
+        Args:
+            write_state (callable): Persists a serialized tournament.
+        """
+        self.write_state = write_state
+        # Latest state waiting to be written, by tournament reference
+        self._pending = {}
+        self._writing = False
+        self._error = None
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, state):
+        """
+        Queues a serialized tournament to be written, replacing its
+        pending state if it has not been written yet.
+
+        Args:
+            state (dict): The serialized tournament.
+        """
+        with self._condition:
+            self.raise_error()
+            # Re-inserted so that tournaments are written in submission order
+            self._pending.pop(state["reference"], None)
+            self._pending[state["reference"]] = state
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self):
+        """Waits until every submitted state has been written."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._pending and not self._writing)
+            self.raise_error()
+
+    def raise_error(self):
+        """Re-raises the error met by the worker thread, if any."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        """Writes the pending states, oldest tournament first (worker thread)."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                reference = next(iter(self._pending))
+                state = self._pending.pop(reference)
+                self._writing = True
+            try:
+                self.write_state(state)
+            except Exception as e:
+                with self._condition:
+                    self._error = e
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
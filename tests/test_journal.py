@@ -0,0 +1,69 @@
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from models.player import Player
+from models.tournament import Tournament
+from storage.json_repository import JsonRepository
+
+
+class LoadDuringCompactionTest(unittest.TestCase):
+    """A tournament loaded while its journal is compacted is up to date."""
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="chess-journal-")
+        self.repository = JsonRepository(self.data_dir)
+        self.repository.journal.COMPACTION_THRESHOLD = 3
+        self.tournament = Tournament("Open", "Paris", "01/06/2025", "02/06/2025",
+                                     4, 2)
+        self.tournament.assign_players([
+            Player("DUPONT", "Jean", "01/01/2000", "AB12345"),
+            Player("MARTIN", "Paul", "01/01/2001", "AB12346")])
+        self.tournament.start_tournament()
+        self.repository.add_tournament(self.tournament.to_dict())
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def save_description(self, description):
+        self.tournament.description = description
+        self.repository.save_tournament_progress(self.tournament.to_dict())
+
+    def test_load_waits_for_the_compaction(self):
+        journal = self.repository.journal
+        write_state = journal.write_state
+        release = threading.Event()
+
+        def slow_write_state(state):
+            # The compaction only completes once the load has started
+            release.wait(5)
+            write_state(state)
+        journal.write_state = slow_write_state
+
+        read_json_file = self.repository.read_json_file
+
+        def slow_read_json_file(path):
+            data = read_json_file(path)
+            # Leaves the time for the compaction to complete in between
+            time.sleep(0.2)
+            return data
+        self.repository.read_json_file = slow_read_json_file
+
+        for index in range(3):
+            self.save_description(f"Ronde {index}")
+        self.assertIn(self.tournament.reference, journal._compaction_threads)
+        timer = threading.Timer(0.05, release.set)
+        timer.start()
+        try:
+            state = self.repository.load_tournament(self.tournament.reference)
+        finally:
+            release.set()
+            timer.join()
+            journal.wait_for_compaction(self.tournament.reference)
+        self.assertEqual(state["description"], "Ronde 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Opt-in instrumentation of the expensive operations (loads, saves, pairing,
+deserialization, report generation).
+
+It is enabled by the CHESS_INSTRUMENTATION environment variable, read when
+the modules are imported:
+    CHESS_INSTRUMENTATION=1 python main.py
+        prints a summary table on the standard error when the main menu is
+        left;
+    CHESS_INSTRUMENTATION=stats.json python main.py
+        writes the statistics to stats.json instead.
+
+When the variable is not set, the timed() decorator returns the functions
+unchanged, so the instrumentation costs nothing. The bytes read and written
+are counted for the JSON files of the default storage backend.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+INSTRUMENTATION_VARIABLE = "CHESS_INSTRUMENTATION"
+
+_setting = os.environ.get(INSTRUMENTATION_VARIABLE, "").strip()
+ENABLED = _setting not in ("", "0")
+
+# Statistics by operation name: calls, cumulative and max time, bytes
+_statistics = {}
+_lock = threading.Lock()
+# Operations being run by the current thread, innermost last
+_active = threading.local()
+
+
+def get_statistics(name):
+    """Returns the statistics of an operation, created on first use."""
+    with _lock:
+        if name not in _statistics:
+            _statistics[name] = {"calls": 0, "total_time": 0.0, "max_time": 0.0,
+                                 "bytes_read": 0, "bytes_written": 0}
+        return _statistics[name]
+
+
+def timed(function):
+    """
+    Decorator recording the calls, wall time and I/O of a function, under
+    its qualified name (e.g. "Player.load_players").
+
+    Args:
+        function (callable): The function to instrument. Apply the
+        decorator below @classmethod or @staticmethod.
+
+    Returns:
+        callable: The instrumented function, or the function itself when
+        the instrumentation is disabled.
+    """
+    if not ENABLED:
+        return function
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        statistics = get_statistics(name)
+        stack = _active.__dict__.setdefault("stack", [])
+        stack.append(statistics)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            with _lock:
+                statistics["calls"] += 1
+                statistics["total_time"] += duration
+                statistics["max_time"] = max(statistics["max_time"], duration)
+    return wrapper
+
+
+def record_io(bytes_read=0, bytes_written=0):
+    """
+    Adds file I/O to the operations being run by the current thread.
+
+    Args:
+        bytes_read (int): The number of bytes read.
+        bytes_written (int): The number of bytes written.
+    """
+    if not ENABLED:
+        return
+    with _lock:
+        for statistics in getattr(_active, "stack", ()):
+            statistics["bytes_read"] += bytes_read
+            statistics["bytes_written"] += bytes_written
+
+
+def report():
+    """
+    Prints the summary table, or writes the statistics to the JSON file
+    named by CHESS_INSTRUMENTATION. Does nothing when disabled.
+    """
+    if not ENABLED:
+        return
+    with _lock:
+        statistics = sorted(_statistics.items(),
+                            key=lambda item: item[1]["total_time"], reverse=True)
+    if _setting.lower().endswith(".json"):
+        with open(_setting, 'w', encoding='utf-8') as file:
+            json.dump(dict(statistics), file, indent=4)
+        return
+    print(f"{'opération':<44} {'appels':>7} {'total (ms)':>11} {'max (ms)':>9} "
+          f"{'lu (Ko)':>9} {'écrit (Ko)':>10}", file=sys.stderr)
+    for name, values in statistics:
+        print(f"{name:<44} {values['calls']:>7} "
+              f"{values['total_time'] * 1000:>11.1f} "
+              f"{values['max_time'] * 1000:>9.1f} "
+              f"{values['bytes_read'] / 1024:>9.1f} "
+              f"{values['bytes_written'] / 1024:>10.1f}", file=sys.stderr)
@@ -0,0 +1,86 @@
+"""
+Capture modes of main.py, to find out what made a session slow on the
+machine where it happened:
+    --profile runs the whole session under cProfile and writes the
+    statistics to a .prof file;
+    --trace-memory compares tracemalloc snapshots taken before and after
+    the loading of the tournaments and the report generation, and prints
+    the lines which allocated the most memory.
+"""
+import cProfile
+import functools
+import sys
+import tracemalloc
+
+# Number of allocation sites printed, or 0 when the memory is not traced
+_memory_top = 0
+
+
+def enable_memory_tracing(top=10):
+    """
+    Starts tracing the memory allocations of the operations decorated
+    with traced_memory().
+
+    Args:
+        top (int): The number of allocation sites printed after each
+        traced operation.
+    """
+    global _memory_top
+    _memory_top = top
+    tracemalloc.start()
+
+
+def traced_memory(function):
+    """
+    Decorator printing the lines which allocated the most memory during a
+    call, when the memory tracing is enabled; otherwise the function is
+    just called.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _memory_top or not tracemalloc.is_tracing():
+            return function(*args, **kwargs)
+        before = tracemalloc.take_snapshot()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            after = tracemalloc.take_snapshot()
+            print_allocations(function.__qualname__,
+                              after.compare_to(before, 'lineno')[:_memory_top])
+    return wrapper
+
+
+def print_allocations(name, statistics):
+    """
+    Prints the allocation sites of an operation on the standard error.
+
+    Args:
+        name (str): The name of the operation.
+        statistics (list): The tracemalloc.StatisticDiff of the sites.
+    """
+    print(f"*** Mémoire allouée par {name} ***", file=sys.stderr)
+    for statistic in statistics:
+        frame = statistic.traceback[0]
+        print(f"{statistic.size_diff / 1024:>10.1f} Ko {statistic.count_diff:>8} "
+              f"blocs  {frame.filename}:{frame.lineno}", file=sys.stderr)
+
+
+def run_profiled(function, output_file):
+    """
+    Runs a function under cProfile and writes the statistics, even if the
+    function exits the application.
+
+    Args:
+        function (callable): The function to profile.
+        output_file (str): The path of the .prof file, readable with
+        `python -m pstats` or snakeviz.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        function()
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output_file)
+        print(f"Profil de la session écrit dans {output_file} "
+              f"(python -m pstats {output_file}).", file=sys.stderr)
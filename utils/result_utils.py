@@ -0,0 +1,141 @@
+import csv
+import json
+import os
+import re
+
+# Same codes as the match by match entry:
+# 1 = win of the first player (black), 2 = win of the second player (white),
+# 3 = draw.
+VALID_RESULTS = (1, 2, 3)
+
+RESULT_ENTRY_PATTERN = re.compile(r'^(\d+)\s*:\s*(\S+)$')
+INTEGER_PATTERN = re.compile(r'^[0-9]+$')
+
+
+def parse_integer(value):
+    """
+    Reads an integer typed by the user or stored in a results file.
+
+    Args:
+        value: An integer (booleans excluded) or a string of digits; other
+        values, such as 1.9 or true in a JSON file, are not integers.
+
+    Returns:
+        int: The integer, or None if the value is not an integer.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and INTEGER_PATTERN.match(value.strip()):
+        return int(value)
+    return None
+
+
+def parse_result_entries(entries):
+    """
+    Validates (board, result) entries and gathers them by board number.
+
+    Args:
+        entries (list): A list of (board, result) pairs, as read from the user
+        input or a file. Boards start at 1.
+
+    Returns:
+        tuple: A dictionary of the results by board number, and the list
+        of the error messages. The results are only usable when there is
+        no error.
+    """
+    results = {}
+    errors = []
+    for board, result in entries:
+        board_number = parse_integer(board)
+        if board_number is None:
+            errors.append(f"Numéro d'échiquier invalide : {board}")
+            continue
+        board = board_number
+        result = parse_integer(result)
+        if result not in VALID_RESULTS:
+            errors.append(f"Échiquier {board} : résultat invalide, "
+                          f"1, 2 ou 3 attendu.")
+        elif board in results:
+            errors.append(f"Échiquier {board} : résultat saisi plusieurs fois.")
+        else:
+            results[board] = result
+    return results, errors
+
+
+def parse_results_text(text):
+    """
+    Parses results typed as a compact list, e.g. "1:1 2:3, 3:2".
+
+    Args:
+        text (str): The "board:result" entries, separated by spaces,
+        commas or semicolons.
+
+    Returns:
+        tuple: The results by board number and the list of error messages.
+    """
+    entries = []
+    errors = []
+    for token in re.split(r'[\s,;]+', text.strip()):
+        if not token:
+            continue
+        entry = RESULT_ENTRY_PATTERN.match(token)
+        if entry:
+            entries.append(entry.groups())
+        else:
+            errors.append(f"Entrée invalide : '{token}' "
+                          f"(format attendu échiquier:résultat).")
+    results, entry_errors = parse_result_entries(entries)
+    return results, errors + entry_errors
+
+
+def load_results_file(path):
+    """
+    Loads the results of a round from a CSV or JSON file.
+
+    A CSV file holds one "board,result" line per match, with an optional
+    header line. A JSON file holds either an object mapping the boards to
+    the results, or a list of {"board": ..., "result": ...} objects.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        tuple: The results by board number and the list of error messages.
+    """
+    if not os.path.exists(path):
+        return {}, [f"Le fichier '{path}' n'existe pas."]
+    extension = os.path.splitext(path)[1].lower()
+    errors = []
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            if extension == ".json":
+                data = json.load(file)
+                if isinstance(data, dict):
+                    entries = list(data.items())
+                elif isinstance(data, list):
+                    entries = []
+                    for position, entry in enumerate(data, start=1):
+                        if isinstance(entry, dict):
+                            entries.append((entry.get("board"), entry.get("result")))
+                        else:
+                            errors.append(f"Entrée {position} : objet "
+                                          f"{{\"board\": ..., \"result\": ...}} "
+                                          f"attendu.")
+                else:
+                    return {}, ["Fichier de résultats invalide : un objet ou "
+                                "une liste JSON est attendu."]
+            elif extension == ".csv":
+                entries = [tuple(row[:2]) for row in csv.reader(file)
+                           if len(row) >= 2]
+                if entries and not entries[0][0].strip().isdigit():
+                    # Header line
+                    entries = entries[1:]
+            else:
+                return {}, ["Format de fichier non pris en charge "
+                            "(CSV ou JSON attendu)."]
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        return {}, [f"Fichier de résultats illisible : {e}"]
+    results, entry_errors = parse_result_entries(entries)
+    return results, errors + entry_errors
@@ -1,5 +1,8 @@
 import re
 
+# Compiled once, as bulk imports validate thousands of identifiers
+NATIONAL_ID_PATTERN = re.compile(r'^[A-Za-z]{2}\d{5}$')
+
 
 def validate_national_id(national_id: str) -> bool:
     """
@@ -11,8 +14,4 @@ def validate_national_id(national_id: str) -> bool:
     Returns:
         bool: True if the national ID is valid, False otherwise.
     """
-    pattern = r'^[A-Za-z]{2}\d{5}$'
-
-    if re.match(pattern, national_id):
-        return True
-    return False
+    return NATIONAL_ID_PATTERN.match(national_id) is not None
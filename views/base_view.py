@@ -1,3 +1,11 @@
+def tabulate(*args, **kwargs):
+    """
+    Formats a table with the tabulate package. The package is only imported
+    when the first table is displayed, as its import slows down the startup.
+    """
+    from tabulate import tabulate as format_table
+    return format_table(*args, **kwargs)
+
 
 class BaseView:
 
@@ -1,5 +1,4 @@
-from tabulate import tabulate
-from views.base_view import BaseView
+from views.base_view import BaseView, tabulate
 
 
 class PlayerView(BaseView):
@@ -20,7 +19,9 @@ class PlayerView(BaseView):
         1. Registering a new player.
         2. Deleting an existing player.
         3. Displaying the list of registered players.
-        4. Returning to the main menu.
+        4. Importing players from a file.
+        5. Searching for players.
+        6. Returning to the main menu.
 
         Returns:
             str: The user's selected option as a string.
@@ -31,7 +32,9 @@ class PlayerView(BaseView):
         print("1. Enregistrer un Nouveau Joueur")
         print("2. Supprimer un Joueur")
         print("3. Liste des Joueurs Enregistrés")
-        print("4. Retour au Menu Principal")
+        print("4. Importer des Joueurs depuis un Fichier")
+        print("5. Rechercher un Joueur")
+        print("6. Retour au Menu Principal")
         print("==========================================")
         return input("Choisir une option: ")
 
@@ -51,6 +54,28 @@ class PlayerView(BaseView):
         """Prompts the user to enter the national chess ID."""
         return input("Identifiant national d'échec: ")
 
+    def get_import_file_path(self):
+        """Prompts the user to enter the path of a players file."""
+        print("Fichier CSV (en-tête last_name,first_name,date_of_birth,national_id),"
+              " JSONL ou JSON.")
+        return input("Chemin du fichier des joueurs: ").strip()
+
+    def get_search_query(self):
+        """Prompts the user to enter a national ID, a year of birth or a name."""
+        return input("Identifiant national, année de naissance ou début du "
+                     "nom de famille: ").strip()
+
+    def display_import_errors(self, errors):
+        """
+        Displays the rows of an import file that were rejected.
+
+        Args:
+            errors (list): The error messages, one per rejected row.
+        """
+        print(f"⚠️ {len(errors)} ligne(s) ignorée(s) :")
+        for error in errors:
+            print(f"- {error}")
+
     def select_players_input(self):
         """
         Prompts the user to select players by entering
@@ -90,6 +115,14 @@ class PlayerView(BaseView):
             print("✅ Joueur créé avec succès.")
         elif message_type == "player_creation_error" and error_message:
             print(f"❌ Erreur lors de la création du joueur : {error_message}")
+        elif message_type == "players_imported" and players is not None:
+            print(f"✅ {len(players)} joueur(s) importé(s) avec succès.")
+        elif message_type == "import_error" and error_message:
+            print(f"❌ Import impossible : {error_message}")
+        elif message_type == "no_matching_players":
+            print("⚠️ Aucun joueur ne correspond à la recherche.")
+        elif message_type == "national_id_taken":
+            print("❌ Cet identifiant national d'échec est déjà enregistré.")
         elif message_type == "players_display_error" and error_message:
             print(f"❌ Une erreur est survenue lors de l'affichage "
                   f"des joueurs : {error_message}")
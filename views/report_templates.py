@@ -0,0 +1,60 @@
+import os
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(BASE_DIR, 'views', 'templates')
+CACHE_DIR = os.path.join(BASE_DIR, 'data', '.cache', 'templates')
+
+# Environment shared by every report generation of the process
+_environment = None
+
+
+def get_environment():
+    """
+    Returns the Jinja2 environment of the report templates, created on
+    first use.
+
+    Compiled templates are kept by the environment and their bytecode is
+    cached under data/.cache, so a template is only compiled again when
+    its file is modified (auto_reload compares the file mtime).
+
+    Returns:
+        jinja2.Environment: The shared environment.
+    """
+    global _environment
+    if _environment is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _environment = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR),
+            bytecode_cache=FileSystemBytecodeCache(CACHE_DIR),
+            auto_reload=True)
+    return _environment
+
+
+def get_template(template_name):
+    """
+    Returns a compiled report template.
+
+    Args:
+        template_name (str): The name of the template file.
+
+    Returns:
+        jinja2.Template: The template.
+    """
+    return get_environment().get_template(template_name)
+
+
+def precompile_templates():
+    """
+    Compiles every report template into the bytecode cache, e.g. right
+    after installation, so that no report generation has to compile them.
+
+    Returns:
+        list: The names of the compiled templates.
+    """
+    environment = get_environment()
+    template_names = environment.list_templates(extensions=["html"])
+    for template_name in template_names:
+        environment.get_template(template_name)
+    return template_names
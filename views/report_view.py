@@ -27,6 +27,17 @@ class ReportView(BaseView):
         print("2. Retour au menu principal")
         return input("Choisir une option: ")
 
+    def display_rendered_pages(self, rendered_count, total_count):
+        """
+        Displays how many tournament pages were rendered again.
+
+        Args:
+            rendered_count (int): The number of pages rendered.
+            total_count (int): The number of tournaments in the report.
+        """
+        print(f"{rendered_count} page(s) de tournoi mise(s) à jour "
+              f"sur {total_count}.")
+
     def display_feedback(self, message_type, error_message=None):
         """
         Displays feedback messages to the user based on the provided message type.
@@ -1,5 +1,4 @@
-from tabulate import tabulate
-from views.base_view import BaseView
+from views.base_view import BaseView, tabulate
 
 
 class TournamentView(BaseView):
@@ -164,6 +163,8 @@ class TournamentView(BaseView):
                   "pour créer un tournoi.")
         elif message_type == "filter_no_tournament":
             print("❌ Aucun tournoi à afficher pour le statut spécifié.")
+        elif message_type == "batch_results_applied":
+            print("✅ Résultats enregistrés.")
         else:
             super().display_feedback(message_type)
 
@@ -202,6 +203,55 @@ class TournamentView(BaseView):
             except ValueError:
                 print("Entrée invalide, veuillez entrer un nombre entier.")
 
+    def prompt_for_result_entry_mode(self):
+        """
+        Asks the user how the results of the round will be entered.
+
+        Returns:
+            str: The option selected by the user.
+        """
+        print("Saisie des résultats du round :")
+        print("1. Match par match")
+        print("2. Saisie groupée (échiquier:résultat)")
+        print("3. Import d'un fichier de résultats (CSV ou JSON)")
+        return input("Choisissez une option: ").strip()
+
+    def display_round_boards(self, round_instance):
+        """Displays the boards of the round whose match is not finished."""
+        table = [[board, f"{match.match[0][0].first_name} "
+                         f"{match.match[0][0].last_name}",
+                  f"{match.match[1][0].first_name} {match.match[1][0].last_name}"]
+                 for board, match in enumerate(round_instance.matches, start=1)
+                 if not match.finished]
+        print(tabulate(table, headers=["Échiquier", "Noirs", "Blancs"],
+                       tablefmt="grid"))
+
+    def get_batch_results(self):
+        """
+        Prompts the user for the results of several boards at once.
+
+        Returns:
+            str: The "board:result" entries typed by the user.
+        """
+        print("Résultats : 1 = victoire des Noirs, 2 = victoire des Blancs, "
+              "3 = égalité.")
+        return input("Entrer les résultats (ex. 1:1 2:3 3:2) : ")
+
+    def get_results_file_path(self):
+        """
+        Prompts the user for the path of a results file.
+
+        Returns:
+            str: The path entered by the user.
+        """
+        return input("Chemin du fichier de résultats (CSV ou JSON) : ").strip()
+
+    def display_batch_errors(self, errors):
+        """Displays the errors found in the results, none of them being saved."""
+        print("❌ Les résultats n'ont pas été enregistrés :")
+        for error in errors:
+            print(f"  - {error}")
+
     def display_match_result(self, match, result):
         """Displays the result of the match based on the result."""
         if result == 1: